@@ -1,15 +1,1508 @@
 #!usr/bin/env python
 # author: gabriel couture
-import copy
-import numpy as np
-import sympy as sm
+import os
+import ast
+import math
+import cmath
+import time
+import bisect
+import hashlib
+import builtins
+import functools
+import tempfile
+import textwrap
+import concurrent.futures
+import heapq
 import inspect
-import scipy.constants as cte
-import matplotlib.pyplot as plt
+import importlib
+import importlib.util
+import itertools
+import linecache
+import multiprocessing
+import threading
+import collections
+import warnings
+import numpy as np
 
 
 ERREUR_ARRONDI_C = 1e-16  # erreur d'arrondi (notée C)
 
+TAILLE_CACHE_GAUSS = 128  # nombre maximal d'ordres N dont les points et poids
+                          # de Gauss-Legendre sont gardés en mémoire
+
+TAILLE_CACHE_SYMBOLIQUE = 256  # nombre maximal de résultats symboliques
+                               # (dérivées, intégrales) gardés en mémoire
+
+TAILLE_CACHE_SERVICE = 1024  # nombre maximal de résultats d'intégration gardés
+                             # par un ServiceIntegration
+
+TAILLE_CACHE_LAMBDIFY = 256  # nombre maximal de fonctions numériques générées
+                             # à partir d'expressions symboliques gardées en mémoire
+
+SEUIL_GAUSS_ASYMPTOTIQUE = 200  # ordre à partir duquel les points de
+                                # Gauss-Legendre sont calculés avec un
+                                # développement asymptotique en O(N)
+
+TAILLE_CACHE_DOUBLE_EXPONENTIELLE = 64  # nombre maximal de niveaux de points et
+                                        # poids de la quadrature double exponentielle
+                                        # gardés en mémoire
+
+T_MAX_DOUBLE_EXPONENTIELLE = 6  # borne |t| des points de la quadrature double
+                                # exponentielle (au-delà, les poids sont
+                                # inférieurs à 1e-300)
+
+# premiers zéros de la fonction de Bessel J0 (approximation des points de
+# Gauss-Legendre près des bornes -1 et 1)
+_ZEROS_BESSEL_J0 = np.array([2.4048255576957724, 5.520078110286311, 8.653727912911013,
+                             11.791534439014281, 14.930917708487787, 18.071063967910924,
+                             21.21163662987926, 24.352471530749302, 27.493479132040253,
+                             30.634606468431976, 33.77582021357357, 36.917098353664045])
+
+
+class _ModuleDiffere:
+    """
+    Remplace un module qui n'est importé qu'au premier accès à
+    l'un de ses attributs. Sympy n'est ainsi chargé que si une
+    méthode symbolique est utilisée
+    """
+    def __init__(self, nom):
+        self.__nom = nom
+        self.__module = None
+
+    def __getattr__(self, attribut):
+        if self.__module is None:
+            self.__module = importlib.import_module(self.__nom)
+        return getattr(self.__module, attribut)
+
+
+sm = _ModuleDiffere('sympy')
+asyncio = _ModuleDiffere('asyncio')
+
+
+# bornes (en secondes) des classes des histogrammes de durées
+_BORNES_HISTOGRAMME = [1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1., 10., 100.]
+
+# instrumentation active dans le fil d'exécution courant (voir _etape)
+_CONTEXTE = threading.local()
+
+
+class Instrumentation:
+    """
+    Mesures d'un objet FonctionAnalytique1D (voir
+    FonctionAnalytique1D.instrumenter) : nombre d'évaluations de
+    la fonction, histogramme des durées de chaque méthode et
+    durées des étapes symboliques ('analyse', 'derive', 'integre',
+    'simplifie', 'lambdify'). Chaque mesure est aussi transmise
+    à une fonction de rappel optionnelle, par exemple pour un
+    système de métriques
+    Attributs :
+        appels : int
+                Nombre d'appels de la fonction
+        points : int
+                Nombre de points auxquels la fonction a été évaluée
+        rappel : function
+                Fonction appelée avec un dict pour chaque mesure :
+                {'type': 'methode' ou 'etape', 'nom': str,
+                 'duree': float, 'fonction': str}, plus 'evaluations'
+                (points évalués pendant la méthode) pour les méthodes
+    """
+    def __init__(self, nom, rappel=None):
+        self.nom = nom
+        self.rappel = rappel
+        self.appels = 0
+        self.points = 0
+        self.__mesures = {'methode': {}, 'etape': {}}
+        self.__verrou = threading.Lock()
+        self.__actives = threading.local()  # méthodes en cours (récursion)
+
+    def compter(self, points):
+        """
+        ------------------------------------------------
+        Compte un appel de la fonction sur un nombre
+        de points
+        ------------------------------------------------
+        """
+        with self.__verrou:
+            self.appels += 1
+            self.points += points
+
+    def enregistrer(self, type_mesure, nom, duree, **details):
+        """
+        ------------------------------------------------
+        Ajoute une durée à l'histogramme d'une méthode
+        ou d'une étape, puis appelle la fonction de rappel
+        ------------------------------------------------
+        """
+        with self.__verrou:
+            mesure = self.__mesures[type_mesure].get(nom)
+            if mesure is None:
+                mesure = {'nombre': 0, 'total': 0., 'min': math.inf, 'max': 0.,
+                          'histogramme': [0] * (len(_BORNES_HISTOGRAMME) + 1)}
+                self.__mesures[type_mesure][nom] = mesure
+            mesure['nombre'] += 1
+            mesure['total'] += duree
+            mesure['min'] = min(mesure['min'], duree)
+            mesure['max'] = max(mesure['max'], duree)
+            mesure['histogramme'][bisect.bisect(_BORNES_HISTOGRAMME, duree)] += 1
+
+        if self.rappel is not None:
+            evenement = {'type': type_mesure, 'nom': nom, 'duree': duree, 'fonction': self.nom}
+            evenement.update(details)
+            self.rappel(evenement)
+
+    def mesurer(self, methode, objet, args, kwargs):
+        """
+        ------------------------------------------------
+        Exécute une méthode de l'objet en mesurant sa
+        durée et le nombre de points évalués. Les étapes
+        symboliques exécutées pendant la méthode sont
+        attribuées à cette instrumentation. Les appels
+        récursifs d'une méthode ne sont mesurés qu'une fois
+        ------------------------------------------------
+        """
+        actives = self.__actives.__dict__.setdefault('cles', set())
+        cle = (id(objet), methode.__name__)
+        if cle in actives:
+            return methode(objet, *args, **kwargs)
+
+        actives.add(cle)
+        precedente = getattr(_CONTEXTE, 'instrumentation', None)
+        _CONTEXTE.instrumentation = self
+        points = self.points
+        debut = time.perf_counter()
+        try:
+            return methode(objet, *args, **kwargs)
+        finally:
+            duree = time.perf_counter() - debut
+            _CONTEXTE.instrumentation = precedente
+            actives.discard(cle)
+            self.enregistrer('methode', methode.__name__, duree,
+                             evaluations=self.points - points)
+
+    def statistiques(self):
+        """
+        ------------------------------------------------
+        Retourne les mesures
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : dict
+            'appels' et 'points' de la fonction, puis pour chaque
+            méthode ('methodes') et étape symbolique ('etapes') :
+            nombre, durées totale, minimale et maximale (s), et
+            histogramme des durées (classes délimitées par
+            'bornes_histogramme')
+        """
+        with self.__verrou:
+            return {'appels': self.appels,
+                    'points': self.points,
+                    'methodes': _copie_mesures(self.__mesures['methode']),
+                    'etapes': _copie_mesures(self.__mesures['etape']),
+                    'bornes_histogramme': list(_BORNES_HISTOGRAMME)}
+
+    def reinitialiser(self):
+        """
+        ------------------------------------------------
+        Remet toutes les mesures à zéro
+        ------------------------------------------------
+        """
+        with self.__verrou:
+            self.appels = 0
+            self.points = 0
+            self.__mesures = {'methode': {}, 'etape': {}}
+
+
+def _copie_mesures(mesures):
+    return {nom: dict(mesure, histogramme=list(mesure['histogramme']))
+            for nom, mesure in mesures.items()}
+
+
+class _etape:
+    """
+    Mesure la durée d'une étape symbolique (bloc with) pour
+    l'instrumentation active dans le fil d'exécution courant.
+    Sans instrumentation active, ne mesure rien
+    """
+    __slots__ = ('nom', 'debut', 'instrumentation')
+
+    def __init__(self, nom):
+        self.nom = nom
+
+    def __enter__(self):
+        self.instrumentation = getattr(_CONTEXTE, 'instrumentation', None)
+        if self.instrumentation is not None:
+            self.debut = time.perf_counter()
+
+    def __exit__(self, *exc):
+        if self.instrumentation is not None:
+            self.instrumentation.enregistrer('etape', self.nom,
+                                             time.perf_counter() - self.debut)
+
+
+class CacheLRU:
+    """
+    Cache de taille bornée qui retire l'élément le moins
+    récemment utilisé lorsqu'il est plein (LRU).
+    Le cache compte les succès, les échecs et les retraits
+    Attributs :
+        taille_max : int
+                Nombre maximal d'éléments conservés
+        succes : int
+                Nombre de recherches ayant trouvé leur élément
+        echecs : int
+                Nombre de recherches n'ayant pas trouvé leur élément
+        evictions : int
+                Nombre d'éléments retirés pour faire de la place
+    """
+    _ABSENT = object()
+
+    def __init__(self, taille_max=128):
+        self.taille_max = taille_max
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.__elements = collections.OrderedDict()
+        self.__verrou = threading.Lock()
+
+    def obtenir(self, cle, defaut=None):
+        """
+        ------------------------------------------------
+        Retourne l'élément associé à la clé, ou défaut
+        s'il n'est pas dans le cache
+        ------------------------------------------------
+        """
+        with self.__verrou:
+            valeur = self.__elements.get(cle, self._ABSENT)
+            if valeur is self._ABSENT:
+                self.echecs += 1
+                return defaut
+            self.__elements.move_to_end(cle)
+            self.succes += 1
+            return valeur
+
+    def ajouter(self, cle, valeur):
+        """
+        ------------------------------------------------
+        Ajoute un élément au cache, en retirant le moins
+        récemment utilisé si le cache est plein
+        ------------------------------------------------
+        """
+        with self.__verrou:
+            self.__elements[cle] = valeur
+            self.__elements.move_to_end(cle)
+            while len(self.__elements) > self.taille_max:
+                self.__elements.popitem(last=False)
+                self.evictions += 1
+
+    def vider(self):
+        """
+        ------------------------------------------------
+        Vide le cache et remet les compteurs à zéro
+        ------------------------------------------------
+        """
+        with self.__verrou:
+            self.__elements.clear()
+            self.succes = 0
+            self.echecs = 0
+            self.evictions = 0
+
+    def statistiques(self):
+        """
+        ------------------------------------------------
+        Retourne les compteurs du cache
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : dict
+            Succès, échecs, retraits, taille et taille maximale
+        """
+        return {'succes': self.succes,
+                'echecs': self.echecs,
+                'evictions': self.evictions,
+                'taille': len(self.__elements),
+                'taille_max': self.taille_max}
+
+    def __len__(self):
+        return len(self.__elements)
+
+    def __contains__(self, cle):
+        return cle in self.__elements
+
+
+# points et poids de Gauss-Legendre sur [-1, 1], indexés par l'ordre N
+_CACHE_GAUSS = CacheLRU(TAILLE_CACHE_GAUSS)
+
+# points et poids de la quadrature double exponentielle, indexés par la
+# transformation et le niveau
+_CACHE_DOUBLE_EXPONENTIELLE = CacheLRU(TAILLE_CACHE_DOUBLE_EXPONENTIELLE)
+
+# résultats des opérations symboliques, indexés par l'opération et la forme
+# canonique (srepr) de l'expression et de la variable
+_CACHE_SYMBOLIQUE = CacheLRU(TAILLE_CACHE_SYMBOLIQUE)
+
+# répertoire où les résultats symboliques sont aussi conservés entre les
+# exécutions (None : aucun stockage sur disque)
+_REPERTOIRE_CACHE_SYMBOLIQUE = None
+
+
+def _calculer_operation(operation, expression, variable, simplifier=True):
+    """
+    Dérive ('derive') ou intègre ('integre') une expression sympy,
+    puis simplifie le résultat : sm.simplify si simplifier est
+    True, sm.cancel (fractions rationnelles seulement) si
+    simplifier est 'rapide', aucune simplification si False
+    """
+    if operation == 'derive':
+        with _etape('derive'):
+            resultat = expression.diff(variable)
+    elif operation == 'integre':
+        with _etape('integre'):
+            resultat = sm.integrate(expression, variable)
+    else:
+        raise ValueError('Opération inconnue : {0}'.format(operation))
+
+    with _etape('simplifie'):
+        if simplifier == 'rapide':
+            resultat = sm.cancel(resultat)
+        elif simplifier:
+            resultat = sm.simplify(resultat)
+    return resultat
+
+
+def _executer_operation(connexion, operation, expression, variable, simplifier):
+    """
+    Exécutée dans un sous-processus (voir _operation_sous_processus) :
+    calcule l'opération sur les formes canoniques (srepr) reçues et
+    renvoie celle du résultat, ou l'erreur
+    """
+    try:
+        resultat = _calculer_operation(operation, sm.sympify(expression),
+                                       sm.sympify(variable), simplifier)
+        connexion.send(('resultat', sm.srepr(resultat)))
+    except Exception as erreur:
+        connexion.send(('erreur', repr(erreur)))
+    finally:
+        connexion.close()
+
+
+def _operation_sous_processus(operation, expression, variable, simplifier, timeout):
+    """
+    Calcule _calculer_operation dans un sous-processus, qui est
+    terminé (le processeur est libéré) si le calcul dépasse
+    timeout secondes. Lève TimeoutError dans ce cas
+    """
+    reception, envoi = multiprocessing.Pipe(duplex=False)
+    processus = multiprocessing.Process(target=_executer_operation,
+                                        args=(envoi, operation, sm.srepr(expression),
+                                              sm.srepr(variable), simplifier),
+                                        daemon=True)
+    with _etape(operation):
+        processus.start()
+        envoi.close()
+        try:
+            if not reception.poll(timeout):
+                raise TimeoutError('Opération symbolique ({0}) interrompue après '
+                                   '{1} s'.format(operation, timeout))
+            etat, texte = reception.recv()
+        except EOFError:
+            etat, texte = 'erreur', 'Le sous-processus s\'est terminé sans résultat'
+        finally:
+            reception.close()
+            if processus.is_alive():
+                processus.terminate()
+            processus.join()
+
+    if etat == 'erreur':
+        raise RuntimeError('Échec de l\'opération symbolique ({0}) : {1}'.format(operation, texte))
+    return sm.sympify(texte)
+
+
+class _DelaiDepasse:
+    """
+    Délai dépassé par une opération symbolique, gardé dans
+    _CACHE_SYMBOLIQUE à la place du résultat
+    """
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+
+def _operation_symbolique(operation, expression, variable, timeout=None, simplifier=True):
+    """
+    Dérive ('derive') ou intègre ('integre') une expression sympy
+    puis simplifie le résultat (voir _calculer_operation). Si
+    timeout est donné, le calcul est fait dans un sous-processus
+    limité à timeout secondes (TimeoutError sinon). Les résultats
+    sont gardés dans _CACHE_SYMBOLIQUE et, si un répertoire est
+    configuré, sur le disque. Un délai dépassé y est aussi gardé :
+    les appels suivants avec un délai au plus aussi long lèvent
+    TimeoutError sans refaire le calcul
+    """
+    cle = (operation, sm.srepr(expression), sm.srepr(variable))
+    if simplifier is not True:
+        cle += (simplifier,)
+    resultat = _CACHE_SYMBOLIQUE.obtenir(cle)
+    if isinstance(resultat, _DelaiDepasse):
+        if timeout is not None and timeout <= resultat.timeout:
+            raise TimeoutError('Opération symbolique ({0}) déjà interrompue après '
+                               '{1} s'.format(operation, resultat.timeout))
+        # délai plus long : nouvel essai
+        resultat = None
+    elif resultat is not None:
+        return resultat
+
+    fichier = None
+    if _REPERTOIRE_CACHE_SYMBOLIQUE is not None:
+        nom = hashlib.sha256(repr(cle).encode()).hexdigest() + '.txt'
+        fichier = os.path.join(_REPERTOIRE_CACHE_SYMBOLIQUE, nom)
+        if os.path.exists(fichier):
+            with open(fichier, encoding='utf-8') as f:
+                resultat = sm.sympify(f.read())
+
+    if resultat is None:
+        if timeout is None:
+            resultat = _calculer_operation(operation, expression, variable, simplifier)
+        else:
+            try:
+                resultat = _operation_sous_processus(operation, expression, variable,
+                                                     simplifier, timeout)
+            except TimeoutError:
+                _CACHE_SYMBOLIQUE.ajouter(cle, _DelaiDepasse(timeout))
+                raise
+
+        if fichier is not None:
+            # écriture atomique (plusieurs processus peuvent partager le répertoire)
+            descripteur, temporaire = tempfile.mkstemp(dir=_REPERTOIRE_CACHE_SYMBOLIQUE)
+            with os.fdopen(descripteur, 'w', encoding='utf-8') as f:
+                f.write(sm.srepr(resultat))
+            os.replace(temporaire, fichier)
+
+    _CACHE_SYMBOLIQUE.ajouter(cle, resultat)
+    return resultat
+
+
+# fonctions numériques générées à partir des expressions symboliques, avec
+# leur code source, indexées par l'expression, la variable et les options
+_CACHE_LAMBDIFY = CacheLRU(TAILLE_CACHE_LAMBDIFY)
+
+# options de génération des fonctions numériques (voir configurer_lambdify)
+_OPTIONS_LAMBDIFY = {'backend': 'auto', 'cse': True}
+
+_COMPTEUR_SOURCES = itertools.count()  # numérote les fichiers des sources générées
+
+
+def _source_numexpr(variable, expression, cse):
+    """
+    Code source d'une fonction évaluant l'expression avec numexpr,
+    les sous-expressions communes étant calculées une seule fois
+    """
+    from sympy.printing.lambdarepr import NumExprPrinter
+
+    imprimante = NumExprPrinter()
+    if cse:
+        symboles = sm.numbered_symbols('_x', exclude=expression.free_symbols)
+        remplacements, (expression,) = sm.cse(expression, symbols=symboles)
+    else:
+        remplacements = []
+
+    lignes = ['def _fonction_generee({0}):'.format(variable),
+              '    {0} = _preparer({0})'.format(variable)]
+    for symbole, sous_expression in remplacements:
+        lignes.append('    {0} = {1}'.format(symbole, imprimante.doprint(sous_expression)))
+    lignes.append('    return ({0})[()]'.format(imprimante.doprint(expression)))
+    return '\n'.join(lignes) + '\n'
+
+
+def _preparer_numexpr(x):
+    # numexpr n'accepte pas certaines fonctions sur des entiers
+    x = np.asarray(x)
+    return x.astype(float) if x.dtype.kind in 'biu' else x
+
+
+def _executer_source(source, espace):
+    """
+    Exécute le code source d'une fonction générée et retourne
+    la fonction. Le code est enregistré dans linecache pour que
+    inspect.getsource fonctionne sur la fonction
+    """
+    nom_fichier = '<fonction_generee-{0}>'.format(next(_COMPTEUR_SOURCES))
+    linecache.cache[nom_fichier] = (len(source), None, source.splitlines(True), nom_fichier)
+    exec(compile(source, nom_fichier, 'exec'), espace)
+    return espace['_fonction_generee']
+
+
+def _compiler_fonction(variable, expression):
+    """
+    Retourne une fonction numérique vectorisée évaluant une
+    expression sympy. Les sous-expressions communes sont
+    éliminées (cse) et le code est généré pour numpy ou, s'il
+    est installé, pour numexpr (voir configurer_lambdify). Les
+    fonctions générées et leur code source sont gardés dans
+    _CACHE_LAMBDIFY
+    """
+    backend = _OPTIONS_LAMBDIFY['backend']
+    cse = _OPTIONS_LAMBDIFY['cse']
+    if backend == 'auto':
+        backend = 'numexpr' if importlib.util.find_spec('numexpr') else 'numpy'
+
+    cle = (sm.srepr(expression), sm.srepr(variable), backend, cse)
+    resultat = _CACHE_LAMBDIFY.obtenir(cle)
+    if resultat is not None:
+        return resultat[0]
+
+    with _etape('lambdify'):
+        fonction, source = _generer_fonction(variable, expression, backend, cse)
+
+    _CACHE_LAMBDIFY.ajouter(cle, (fonction, source))
+    return fonction
+
+
+def _generer_fonction(variable, expression, backend, cse):
+    """
+    Génère la fonction numérique d'une expression et son code
+    source (voir _compiler_fonction)
+    """
+    fonction = None
+    if not expression.free_symbols:
+        # expression constante : le résultat a la forme de l'argument. Les
+        # noms globaux de la fonction diffèrent de celui de la variable
+        valeur = complex(expression)
+        nom_np, nom_valeur = ('_np', '_valeur') if str(variable)[:1] != '_' else ('np', 'valeur')
+        espace = {nom_np: np, nom_valeur: valeur.real if valeur.imag == 0 else valeur}
+        source = ('def _fonction_generee({0}):\n'
+                  '    return {1}.full({1}.shape({0}), {2})[()]\n'.format(variable, nom_np,
+                                                                      nom_valeur))
+        fonction = _executer_source(source, espace)
+    elif backend == 'numexpr':
+        import numexpr
+        try:
+            source = _source_numexpr(variable, expression, cse)
+            espace = {'numexpr': numexpr, 'math': math, '_preparer': _preparer_numexpr}
+            fonction = _executer_source(source, espace)
+            fonction(np.array([0.5]))  # numexpr ne supporte pas toutes les fonctions
+        except Exception:
+            fonction = None
+
+    if fonction is None:
+        # comme sympy, scipy est utilisé s'il est installé (fonctions spéciales)
+        modules = ['scipy', 'numpy'] if importlib.util.find_spec('scipy') else 'numpy'
+        fonction = sm.lambdify(variable, expression, modules=modules, cse=cse)
+        source = inspect.getsource(fonction)
+    return fonction, source
+
+
+# différences centrées pour les dérivées d'ordre 1 à 4 (erreur en h**2) :
+# décalages des points en unités du pas h et coefficients associés
+_DIFFERENCES_CENTREES = {
+    1: (np.array([-1/2, 1/2]), np.array([-1, 1])),
+    2: (np.array([-1, 0, 1]), np.array([1, -2, 1])),
+    3: (np.array([-2, -1, 1, 2]), np.array([-1/2, 1, -1, 1/2])),
+    4: (np.array([-2, -1, 0, 1, 2]), np.array([1, -4, 6, -4, 1])),
+}
+
+
+class NombreDual:
+    """
+    Nombre dual tronqué au deuxième ordre pour la dérivation
+    automatique (mode direct). Chaque composante peut être un
+    tableau numpy : une seule évaluation de la fonction donne
+    alors les dérivées en tous les points.
+    Les opérateurs arithmétiques et les ufuncs numpy usuelles
+    (exp, log, sin, sqrt, ...) propagent les dérivées par la
+    règle de dérivation en chaîne. Les comparaisons portent sur
+    la valeur, ce qui permet les fonctions avec des conditions
+    (pour des points scalaires)
+    Attributs :
+        valeur : numpy.ndarray
+                Valeur de la fonction
+        d1 : numpy.ndarray
+                Dérivée première
+        d2 : numpy.ndarray
+                Dérivée seconde (None si elle n'est pas calculée)
+    """
+    __array_priority__ = 1000
+
+    def __init__(self, valeur, d1, d2=None):
+        self.valeur = valeur
+        self.d1 = d1
+        self.d2 = d2
+
+    @staticmethod
+    def _dual(objet, d2):
+        # une constante est un nombre dual de dérivées nulles
+        if isinstance(objet, NombreDual):
+            return objet
+        objet = np.asarray(objet)
+        zero = np.zeros_like(objet, dtype=float)
+        return NombreDual(objet, zero, zero if d2 else None)
+
+    def _appliquer(self, g, dg, d2g):
+        # règle de dérivation en chaîne pour une fonction g d'une variable,
+        # de dérivées dg et d2g, toutes évaluées en self.valeur
+        d2 = None
+        if self.d2 is not None:
+            d2 = d2g*self.d1**2 + dg*self.d2
+        return NombreDual(g, dg*self.d1, d2)
+
+    def __array_ufunc__(self, ufunc, methode, *entrees, **kwargs):
+        if methode != '__call__' or kwargs:
+            return NotImplemented
+
+        if len(entrees) == 1:
+            regle = _REGLES_UFUNC_UNAIRES.get(ufunc)
+            if regle is None:
+                return NotImplemented
+            v = self.valeur
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return self._appliquer(*regle(v))
+
+        u, w = entrees
+        d2 = any(isinstance(e, NombreDual) and e.d2 is not None for e in entrees)
+        if ufunc is np.add:
+            u, w = NombreDual._dual(u, d2), NombreDual._dual(w, d2)
+            return NombreDual(u.valeur + w.valeur, u.d1 + w.d1,
+                              u.d2 + w.d2 if d2 else None)
+        if ufunc is np.subtract:
+            return np.add(u, np.negative(w))
+        if ufunc is np.multiply:
+            u, w = NombreDual._dual(u, d2), NombreDual._dual(w, d2)
+            return NombreDual(u.valeur*w.valeur, u.d1*w.valeur + u.valeur*w.d1,
+                              u.d2*w.valeur + 2*u.d1*w.d1 + u.valeur*w.d2 if d2 else None)
+        if ufunc in (np.true_divide, np.divide):
+            return np.multiply(u, np.reciprocal(NombreDual._dual(w, d2)))
+        if ufunc is np.power:
+            if not isinstance(w, NombreDual):
+                # exposant constant
+                c = np.asarray(w, float)
+                v = u.valeur
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    dg = np.where(c == 0, 0, c*v**(c - 1))
+                    d2g = np.where(c*(c - 1) == 0, 0, c*(c - 1)*v**(c - 2))
+                return u._appliquer(v**c, dg, d2g)
+            if not isinstance(u, NombreDual):
+                # base constante
+                c = np.asarray(u, float)
+                g = c**w.valeur
+                return w._appliquer(g, g*np.log(c), g*np.log(c)**2)
+            return np.exp(w*np.log(u))
+        return NotImplemented
+
+    def __add__(self, autre):
+        return np.add(self, autre)
+
+    def __radd__(self, autre):
+        return np.add(autre, self)
+
+    def __sub__(self, autre):
+        return np.subtract(self, autre)
+
+    def __rsub__(self, autre):
+        return np.subtract(autre, self)
+
+    def __mul__(self, autre):
+        return np.multiply(self, autre)
+
+    def __rmul__(self, autre):
+        return np.multiply(autre, self)
+
+    def __truediv__(self, autre):
+        return np.true_divide(self, autre)
+
+    def __rtruediv__(self, autre):
+        return np.true_divide(autre, self)
+
+    def __pow__(self, autre):
+        return np.power(self, autre)
+
+    def __rpow__(self, autre):
+        return np.power(autre, self)
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __lt__(self, autre):
+        return self.valeur < NombreDual._dual(autre, False).valeur
+
+    def __le__(self, autre):
+        return self.valeur <= NombreDual._dual(autre, False).valeur
+
+    def __gt__(self, autre):
+        return self.valeur > NombreDual._dual(autre, False).valeur
+
+    def __ge__(self, autre):
+        return self.valeur >= NombreDual._dual(autre, False).valeur
+
+
+# règles de dérivation des ufuncs d'une variable : pour une valeur v,
+# retourne g(v), g'(v) et g''(v)
+_REGLES_UFUNC_UNAIRES = {
+    np.negative: lambda v: (-v, -np.ones_like(v), np.zeros_like(v)),
+    np.positive: lambda v: (v, np.ones_like(v), np.zeros_like(v)),
+    np.exp: lambda v: (np.exp(v), np.exp(v), np.exp(v)),
+    np.expm1: lambda v: (np.expm1(v), np.exp(v), np.exp(v)),
+    np.log: lambda v: (np.log(v), 1/v, -1/v**2),
+    np.log10: lambda v: (np.log10(v), 1/(v*np.log(10)), -1/(v**2*np.log(10))),
+    np.log2: lambda v: (np.log2(v), 1/(v*np.log(2)), -1/(v**2*np.log(2))),
+    np.log1p: lambda v: (np.log1p(v), 1/(1 + v), -1/(1 + v)**2),
+    np.sqrt: lambda v: (np.sqrt(v), 1/(2*np.sqrt(v)), -1/(4*v*np.sqrt(v))),
+    np.cbrt: lambda v: (np.cbrt(v), 1/(3*np.cbrt(v)**2), -2/(9*np.cbrt(v)**5)),
+    np.square: lambda v: (v**2, 2*v, 2*np.ones_like(v)),
+    np.reciprocal: lambda v: (1/v, -1/v**2, 2/v**3),
+    np.absolute: lambda v: (np.abs(v), np.sign(v), np.zeros_like(v)),
+    np.sin: lambda v: (np.sin(v), np.cos(v), -np.sin(v)),
+    np.cos: lambda v: (np.cos(v), -np.sin(v), -np.cos(v)),
+    np.tan: lambda v: (np.tan(v), 1 + np.tan(v)**2, 2*np.tan(v)*(1 + np.tan(v)**2)),
+    np.arcsin: lambda v: (np.arcsin(v), 1/np.sqrt(1 - v**2), v/(1 - v**2)**1.5),
+    np.arccos: lambda v: (np.arccos(v), -1/np.sqrt(1 - v**2), -v/(1 - v**2)**1.5),
+    np.arctan: lambda v: (np.arctan(v), 1/(1 + v**2), -2*v/(1 + v**2)**2),
+    np.sinh: lambda v: (np.sinh(v), np.cosh(v), np.sinh(v)),
+    np.cosh: lambda v: (np.cosh(v), np.sinh(v), np.cosh(v)),
+    np.tanh: lambda v: (np.tanh(v), 1 - np.tanh(v)**2, -2*np.tanh(v)*(1 - np.tanh(v)**2)),
+    np.arcsinh: lambda v: (np.arcsinh(v), 1/np.sqrt(1 + v**2), -v/(1 + v**2)**1.5),
+    np.arccosh: lambda v: (np.arccosh(v), 1/np.sqrt(v**2 - 1), -v/(v**2 - 1)**1.5),
+    np.arctanh: lambda v: (np.arctanh(v), 1/(1 - v**2), 2*v/(1 - v**2)**2),
+}
+
+
+class ProxyChebyshev:
+    """
+    Représentation d'une fonction sur [a, b] par une série de
+    Chebyshev, sum(c_k T_k(s)), avec s = (2x - a - b)/(b - a).
+    Une fois construite (voir FonctionAnalytique1D.chebyshev),
+    elle est évaluée (algorithme de Clenshaw), intégrée, dérivée
+    et ses racines sont trouvées sans appeler la fonction d'origine
+    Attributs :
+        coefficients : numpy.ndarray
+                Coefficients c_k de la série (lecture seule)
+        a, b : float
+                Bornes du domaine
+        erreur : float
+                Estimation de l'erreur d'interpolation (amplitude des
+                derniers coefficients calculés)
+        nb_evaluations : int
+                Nombre d'évaluations de la fonction d'origine pour la
+                construction
+        converge : bool
+                False si la tolérance n'a pas été atteinte avant
+                degre_max (fonction non lisse, ex. abs)
+    """
+    DEGRE_RACINES = 100  # au-delà, le domaine est divisé pour trouver les racines
+
+    def __init__(self, coefficients, a, b, erreur=0.0, nb_evaluations=0, converge=True):
+        self.coefficients = np.array(coefficients)
+        self.coefficients.flags.writeable = False
+        self.a = float(a)
+        self.b = float(b)
+        self.erreur = erreur
+        self.nb_evaluations = nb_evaluations
+        self.converge = converge
+
+    @property
+    def degre(self):
+        return len(self.coefficients) - 1
+
+    @staticmethod
+    def construire(evaluer, a, b, tol=1e-14, degre_max=2**16):
+        """
+        ------------------------------------------------
+        Construit la série par interpolation aux points
+        de Chebyshev x_j = cos(pi*j/n). Le nombre de
+        points n est doublé (les points précédents sont
+        réutilisés) jusqu'à ce que les derniers
+        coefficients soient négligeables, puis la série
+        est tronquée. Les coefficients sont obtenus par
+        FFT (transformée en cosinus)
+        ------------------------------------------------
+        Paramètres
+        ============
+        evaluer : function
+            Fonction évaluée sur un tableau de points
+        a : float
+            Borne inférieure du domaine
+        b : float
+            Borne supérieure du domaine
+        tol : float
+            default : 1e-14
+            Tolérance relative sur les coefficients
+        degre_max : int
+            default : 2**16
+            Degré maximal de la série
+        Retourne
+        ============
+        résultat : ProxyChebyshev
+        """
+        milieu, demi_largeur = (a + b) / 2, (b - a) / 2
+        n = 16
+        valeurs = evaluer(milieu + demi_largeur * np.cos(np.pi * np.arange(n + 1) / n))
+        nb_evaluations = n + 1
+
+        while True:
+            # transformée en cosinus de l'extension paire des valeurs
+            c = np.fft.rfft(np.concatenate((valeurs, valeurs[-2:0:-1]))) / n
+            c = c.real if np.isrealobj(valeurs) else c
+            c[0] /= 2
+            c[-1] /= 2
+
+            echelle = max(np.abs(valeurs).max(), np.finfo(float).tiny)
+            queue = np.abs(c[-max(3, n // 8):]).max()
+            if queue <= tol * echelle or 2 * n > degre_max:
+                break
+
+            # seuls les nouveaux points (indices impairs) sont évalués
+            nouvelles = evaluer(milieu + demi_largeur * np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n)))
+            nb_evaluations += n
+            n *= 2
+            tableau = np.empty(n + 1, dtype=np.result_type(valeurs, nouvelles))
+            tableau[::2] = valeurs
+            tableau[1::2] = nouvelles
+            valeurs = tableau
+
+        # troncature des coefficients négligeables
+        significatifs = np.nonzero(np.abs(c) > tol * echelle)[0]
+        c = c[:significatifs[-1] + 1] if len(significatifs) else c[:1]
+        return ProxyChebyshev(c, a, b, queue, nb_evaluations, queue <= tol * echelle)
+
+    def __variable(self, x):
+        # x dans [a, b] vers s dans [-1, 1]
+        return (2 * np.asarray(x, float) - self.a - self.b) / (self.b - self.a)
+
+    def __call__(self, x):
+        """
+        ------------------------------------------------
+        Évalue la série (algorithme de Clenshaw) en un
+        point ou un tableau de points
+        ------------------------------------------------
+        """
+        return np.polynomial.chebyshev.chebval(self.__variable(x), self.coefficients)[()]
+
+    def integrale(self, c=None, d=None):
+        """
+        ------------------------------------------------
+        Intégrale exacte de la série entre c et d
+        (intégration de Clenshaw-Curtis)
+        ------------------------------------------------
+        Paramètres
+        ============
+        c : float
+            default : None
+            Borne inférieure de l'intégrale (a si None)
+        d : float
+            default : None
+            Borne supérieure de l'intégrale (b si None)
+        Retourne
+        ============
+        résultat : float ou numpy.ndarray
+            Résultat de l'intégrale
+        """
+        c = self.a if c is None else c
+        d = self.b if d is None else d
+        primitive = np.polynomial.chebyshev.chebint(self.coefficients) * (self.b - self.a) / 2
+        return (np.polynomial.chebyshev.chebval(self.__variable(d), primitive) -
+                np.polynomial.chebyshev.chebval(self.__variable(c), primitive))[()]
+
+    def derivee(self, ordre=1):
+        """
+        ------------------------------------------------
+        Retourne la dérivée de la série, elle-même une
+        série de Chebyshev sur [a, b]
+        ------------------------------------------------
+        Paramètres
+        ============
+        ordre : int
+            default : 1
+            Ordre de la dérivée
+        Retourne
+        ============
+        résultat : ProxyChebyshev
+        """
+        coefficients = np.polynomial.chebyshev.chebder(self.coefficients, ordre,
+                                                       scl=2 / (self.b - self.a))
+        if len(coefficients) == 0:
+            coefficients = np.zeros(1)
+        return ProxyChebyshev(coefficients, self.a, self.b, converge=self.converge)
+
+    def racines(self):
+        """
+        ------------------------------------------------
+        Retourne les racines réelles de la série dans
+        [a, b], triées. Elles sont les valeurs propres
+        de la matrice compagne de la série (colleague
+        matrix) ; pour un degré élevé, le domaine est
+        d'abord divisé en deux. Si la série n'a pas
+        convergé, son degré est trop élevé pour que
+        les racines soient trouvées rapidement : une
+        ValueError est levée (construire la série sur
+        des sous-intervalles où la fonction est lisse)
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : numpy.ndarray
+            Racines dans [a, b]
+        """
+        if not self.converge and self.degre > self.DEGRE_RACINES:
+            raise ValueError('La série de degré {0} n\'a pas convergé (erreur {1:.3g}) : '
+                             'racines non calculées'.format(self.degre, self.erreur))
+        return self.__racines()
+
+    def __racines(self):
+        # racines de la série, le domaine étant divisé si le degré est élevé
+        c = self.coefficients
+        echelle = np.abs(c).max()
+        if echelle == 0:
+            return np.array([])
+
+        # les derniers coefficients négligeables sont retirés
+        significatifs = np.nonzero(np.abs(c) > np.finfo(float).eps * echelle)[0]
+        c = c[:significatifs[-1] + 1]
+        if len(c) <= 1:
+            return np.array([])
+
+        if len(c) - 1 > self.DEGRE_RACINES:
+            # division légèrement décentrée (évite une racine au milieu exact).
+            # Chaque moitié est une série de degré au plus celui-ci (la
+            # restriction d'un polynôme reste un polynôme du même degré),
+            # précise comme la série elle-même
+            milieu = self.a + (self.b - self.a) * 0.5024249
+            tol = max(1e-14, self.erreur / echelle)
+            gauche = ProxyChebyshev.construire(self, self.a, milieu, tol, len(c) - 1)
+            droite = ProxyChebyshev.construire(self, milieu, self.b, tol, len(c) - 1)
+            racines = np.concatenate((gauche.__racines(), droite.__racines()))
+            return np.unique(racines)
+
+        s = np.polynomial.chebyshev.chebroots(c)
+        tolerance = 1e-8
+        s = s[(np.abs(s.imag) <= tolerance) & (np.abs(s.real) <= 1 + tolerance)].real
+        s = np.clip(np.sort(s), -1, 1)
+        return self.a + (s + 1) * (self.b - self.a) / 2
+
+    def __len__(self):
+        return len(self.coefficients)
+
+
+# points ajoutés par Kronrod aux 7 points de Gauss-Legendre (règle à 15 points)
+# et poids de Kronrod associés, aux points de Gauss puis aux points ajoutés
+# (QUADPACK, qk15)
+_KRONROD_POINTS = np.array([0.991455371120812639206854697526329,
+                            0.864864423359769072789712788640926,
+                            0.586087235467691130294144845693013,
+                            0.207784955007898467600689403773245])
+_KRONROD_POIDS_GAUSS = np.array([0.063092092629978553290700663189204,
+                                 0.140653259715525918745189590510238,
+                                 0.190350578064785409913256402421014,
+                                 0.209482141084727828012999174891714])
+_KRONROD_POIDS_AJOUTS = np.array([0.022935322010529224963732008058970,
+                                  0.104790010322250183839876322541518,
+                                  0.169004726639267902826583426598550,
+                                  0.204432940075298892414161999234649])
+
+
+def _legendre_recurrence(N, x):
+    """
+    Évalue P_N(x) et P_{N-1}(x) avec la relation de récurrence
+    de Abramowitz and Stegun 22.7.10 (O(N) par point)
+    """
+    p0 = np.ones(len(x), float)
+    p1 = np.copy(x)
+    for k in range(1, N):
+        p0, p1 = p1, ((2*k + 1)*x*p1 - k*p0)/(k + 1)
+    return p1, p0
+
+
+def _gaussxw_newton(N, x):
+    """
+    Raffine les racines approximatives x de P_N par la méthode de
+    Newton et retourne les points et les poids correspondants
+    """
+    epsilon = 1e-15
+    delta = 1.0
+    while delta > epsilon:
+        p1, p0 = _legendre_recurrence(N, x)
+        dp = N*(p0 - x*p1)/((1 - x)*(1 + x))
+        dx = p1/dp
+        x -= dx
+        delta = max(abs(dx))
+
+    # la dérivée est réévaluée aux racines finales pour le calcul des poids
+    p1, p0 = _legendre_recurrence(N, x)
+    dp = N*(p0 - x*p1)/((1 - x)*(1 + x))
+    w = 2/((1 - x)*(1 + x)*dp*dp)
+
+    return x, w
+
+
+def _gaussxw_asymptotique(N, nb_termes=20, seuil=25):
+    """
+    Points et poids de Gauss-Legendre en O(N) pour les grands N.
+    Les points intérieurs sont trouvés par la méthode de Newton en
+    theta (x = cos(theta)) sur le développement asymptotique de
+    P_N(cos(theta)) (Hale et Townsend, 2013). Les quelques points
+    près des bornes, où ce développement ne converge pas, sont
+    approximés par les zéros de la fonction de Bessel J0 puis
+    raffinés avec la relation de récurrence
+    """
+    # approximation initiale de Tricomi
+    k = np.arange(1, N + 1)
+    theta = np.arccos((1 - 1/(8*N**2) + 1/(8*N**3)) * np.cos(np.pi*(4*k - 1)/(4*N + 2)))
+
+    interieur = N*np.sin(theta) >= seuil
+    nb_bord = int(np.count_nonzero(~interieur)) // 2
+    if nb_bord > len(_ZEROS_BESSEL_J0):
+        # développement inutilisable pour un N aussi petit
+        return _gaussxw_newton(N, np.cos(theta))
+
+    # constante C_N = 4/pi * prod_{j=1}^{N} j/(j+1/2)
+    j = np.arange(1, N + 1)
+    C = 4/np.pi*np.exp(np.sum(np.log1p(-1/(2*j + 1))))
+
+    # coefficients h_{N,m} du développement
+    h = np.ones(nb_termes)
+    for m in range(1, nb_termes):
+        h[m] = h[m-1]*(m - 0.5)**2/(m*(N + m + 0.5))
+
+    # Newton en theta sur les points intérieurs
+    th = theta[interieur]
+    for _ in range(10):
+        sin_th = np.sin(th)
+        cot_th = np.cos(th)/sin_th
+        somme = np.zeros_like(th)
+        derivee_somme = np.zeros_like(th)
+        for m in range(nb_termes):
+            alpha = (N + m + 0.5)*th - (m + 0.5)*np.pi/2
+            facteur = h[m]*(2*sin_th)**(-(m + 0.5))
+            somme += facteur*np.cos(alpha)
+            derivee_somme -= facteur*((N + m + 0.5)*np.sin(alpha) + (m + 0.5)*cot_th*np.cos(alpha))
+        dth = somme/derivee_somme
+        th -= dth
+        if np.max(np.abs(dth)) < 1e-15:
+            break
+
+    x = np.empty(N)
+    w = np.empty(N)
+    x[interieur] = np.cos(th)
+    w[interieur] = 2/(C*derivee_somme)**2  # w = 2/(dP/dtheta)^2
+
+    # points près des bornes : approximation de Bessel puis Newton
+    if nb_bord:
+        rho = N + 0.5
+        psi = _ZEROS_BESSEL_J0[:nb_bord]/rho
+        theta_bord = psi + (psi/np.tan(psi) - 1)/(8*psi*rho**2)
+        x_bord, w_bord = _gaussxw_newton(N, np.cos(theta_bord))
+        x[:nb_bord], w[:nb_bord] = x_bord, w_bord
+        x[-nb_bord:], w[-nb_bord:] = -x_bord[::-1], w_bord[::-1]
+
+    return x, w
+
+
+def _noeuds_double_exponentielle(transformation, niveau):
+    """
+    Points et poids de la quadrature double exponentielle ajoutés
+    au niveau donné (pas h = 2**-niveau sur t, seuls les multiples
+    impairs de h sont nouveaux pour niveau > 0). Retourne (t, y, w),
+    où selon la transformation :
+        'tanh_sinh' : y est la distance à la borne la plus proche,
+                      en demi-largeurs de l'intervalle (x = b - d*y
+                      si t >= 0, x = a + d*y sinon), w en demi-largeurs
+        'exp_sinh'  : y est la distance à la borne finie
+        'sinh_sinh' : y est le point x
+    Les tableaux sont gardés dans _CACHE_DOUBLE_EXPONENTIELLE
+    """
+    cle = (transformation, niveau)
+    noeuds = _CACHE_DOUBLE_EXPONENTIELLE.obtenir(cle)
+    if noeuds is not None:
+        return noeuds
+
+    if niveau == 0:
+        t = np.arange(-T_MAX_DOUBLE_EXPONENTIELLE, T_MAX_DOUBLE_EXPONENTIELLE + 1, dtype=float)
+    else:
+        h = 2.0**-niveau
+        positifs = h * np.arange(1, T_MAX_DOUBLE_EXPONENTIELLE * 2**niveau, 2)
+        t = np.concatenate((-positifs[::-1], positifs))
+
+    u = np.pi / 2 * np.sinh(t)
+    if transformation == 'tanh_sinh':
+        # 1 - tanh(|u|) sans perte de précision près des bornes
+        y = 1 / (np.exp(np.abs(u)) * np.cosh(u))
+        w = np.pi / 2 * np.cosh(t) / np.cosh(u)**2
+    elif transformation == 'exp_sinh':
+        y = np.exp(u)
+        w = np.pi / 2 * np.cosh(t) * y
+    elif transformation == 'sinh_sinh':
+        y = np.sinh(u)
+        w = np.pi / 2 * np.cosh(t) * np.cosh(u)
+    else:
+        raise ValueError('Transformation inconnue : {0}'.format(transformation))
+
+    noeuds = (t, y, w)
+    for tableau in noeuds:
+        tableau.flags.writeable = False
+    _CACHE_DOUBLE_EXPONENTIELLE.ajouter(cle, noeuds)
+    return noeuds
+
+
+# correspondance entre les fonctions numériques (numpy, math, cmath, scipy)
+# et les fonctions sympy, indexées par leur nom (construite au premier usage,
+# voir _fonctions_sympy)
+_FONCTIONS_SYMPY = None
+
+
+def _fonctions_sympy():
+    """
+    Retourne la correspondance entre les noms des fonctions
+    numériques et les fonctions sympy
+    """
+    global _FONCTIONS_SYMPY
+
+    if _FONCTIONS_SYMPY is None:
+        _FONCTIONS_SYMPY = {
+            'sin': sm.sin, 'cos': sm.cos, 'tan': sm.tan, 'cot': sm.cot, 'sec': sm.sec, 'csc': sm.csc,
+            'arcsin': sm.asin, 'arccos': sm.acos, 'arctan': sm.atan, 'asin': sm.asin,
+            'acos': sm.acos, 'atan': sm.atan, 'acot': sm.acot, 'asec': sm.asec, 'acsc': sm.acsc,
+            'sinh': sm.sinh, 'cosh': sm.cosh, 'tanh': sm.tanh, 'coth': sm.coth, 'sech': sm.sech,
+            'csch': sm.csch, 'arcsinh': sm.asinh, 'arccosh': sm.acosh, 'arctanh': sm.atanh,
+            'asinh': sm.asinh, 'acosh': sm.acosh, 'atanh': sm.atanh, 'acoth': sm.acoth,
+            'asech': sm.asech, 'acsch': sm.acsch,
+            'exp': sm.exp, 'exp2': lambda u: 2**u, 'expm1': lambda u: sm.exp(u) - 1,
+            'log': sm.log, 'ln': sm.log, 'log10': lambda u: sm.log(u, 10),
+            'log2': lambda u: sm.log(u, 2), 'log1p': lambda u: sm.log(1 + u),
+            'sqrt': sm.sqrt, 'cbrt': sm.cbrt, 'square': lambda u: u**2, 'power': sm.Pow,
+            'pow': sm.Pow, 'reciprocal': lambda u: 1/u, 'abs': sm.Abs, 'absolute': sm.Abs,
+            'fabs': sm.Abs, 'sign': sm.sign, 'arctan2': sm.atan2, 'atan2': sm.atan2,
+            'hypot': lambda u, v: sm.sqrt(u**2 + v**2), 'sinc': lambda u: sm.sinc(sm.pi*u),
+        }
+    return _FONCTIONS_SYMPY
+
+
+# modules dont les fonctions sont traduites par leur nom
+_MODULES_NUMERIQUES = ('numpy', 'math', 'cmath', 'scipy', 'builtins')
+
+# opérateurs binaires et unaires supportés
+_OPERATEURS_BINAIRES = {
+    ast.Add: lambda u, v: u + v,
+    ast.Sub: lambda u, v: u - v,
+    ast.Mult: lambda u, v: u * v,
+    ast.Div: lambda u, v: u / v,
+    ast.Pow: lambda u, v: u ** v,
+    ast.Mod: lambda u, v: sm.Mod(u, v),
+    ast.FloorDiv: lambda u, v: sm.floor(u / v),
+}
+_OPERATEURS_UNAIRES = {
+    ast.USub: lambda u: -u,
+    ast.UAdd: lambda u: u,
+}
+
+
+class _ExpressionNonSupportee(Exception):
+    """
+    Levée lorsque le code d'une fonction ne peut pas être
+    traduit en expression symbolique
+    """
+
+
+class _CompilateurExpression:
+    """
+    Traduit une fonction Python en expression sympy en parcourant
+    l'arbre syntaxique (ast) de son code source. Les affectations
+    sont substituées dans l'expression retournée, les noms sont
+    résolus dans l'espace de noms de la fonction (variables
+    globales, fermeture et valeurs par défaut), les appels numpy,
+    math et scipy sont traduits en fonctions sympy et les autres
+    objets FonctionAnalytique1D (ou fonctions Python) appelés sont
+    remplacés par leur propre expression
+    Attributs :
+        fonc : function
+                La fonction à traduire
+        variable : string
+                Nom de la variable de la fonction (None tant
+                qu'il n'est pas trouvé)
+    """
+    PROFONDEUR_MAX = 20  # nombre maximal de fonctions imbriquées
+
+    def __init__(self, fonc, profondeur=0):
+        self.fonc = fonc
+        self.variable = None
+        self.__profondeur = profondeur
+        self.__locales = {}
+
+        # espace de noms de la fonction : globales, fermeture
+        self.__espace = dict(getattr(fonc, '__globals__', {}))
+        code = getattr(fonc, '__code__', None)
+        if code is not None and fonc.__closure__:
+            for nom, cellule in zip(code.co_freevars, fonc.__closure__):
+                try:
+                    self.__espace[nom] = cellule.cell_contents
+                except ValueError:
+                    pass
+
+    def compiler(self):
+        """
+        ------------------------------------------------
+        Retourne l'expression sympy de la fonction
+        ------------------------------------------------
+        """
+        if self.__profondeur > self.PROFONDEUR_MAX:
+            raise _ExpressionNonSupportee('Trop de fonctions imbriquées')
+
+        noeud = self.__trouver_noeud()
+        arguments = noeud.args
+        if not arguments.args:
+            raise _ExpressionNonSupportee('La fonction n\'a pas d\'argument')
+
+        # la variable est le premier argument, les autres doivent avoir une
+        # valeur par défaut
+        self.variable = arguments.args[0].arg
+        parametres = list(inspect.signature(self.fonc).parameters.values())[1:]
+        for parametre in parametres:
+            if parametre.default is inspect.Parameter.empty:
+                raise _ExpressionNonSupportee('Argument en trop : {0}'.format(parametre.name))
+            self.__locales[parametre.name] = self.__constante(parametre.name, parametre.default)
+
+        if isinstance(noeud, ast.Lambda):
+            expression = self.__expression(noeud.body)
+        else:
+            expression = self.__corps(noeud.body)
+
+        expression = sm.sympify(expression)
+        if not expression.free_symbols <= {sm.Symbol(self.variable)}:
+            raise _ExpressionNonSupportee('Symboles inconnus dans l\'expression')
+        return expression
+
+    def __trouver_noeud(self):
+        # définition de la fonction (ou lambda) dans son code source. Le noeud
+        # est identifié par la position du code de la fonction (plusieurs
+        # lambdas peuvent être sur la même ligne)
+        lignes, premiere_ligne = inspect.getsourcelines(self.fonc)
+        source = textwrap.dedent(''.join(lignes))
+        retrait = len(lignes[0]) - len(source.splitlines(True)[0])
+        code = self.fonc.__code__
+        nom = self.fonc.__name__
+
+        def position(noeud):
+            # position absolue (ligne, fin, colonne, fin) d'un noeud
+            return (noeud.lineno + premiere_ligne - 1, noeud.end_lineno + premiere_ligne - 1,
+                    noeud.col_offset + retrait, noeud.end_col_offset + retrait)
+
+        candidats = []
+        for noeud in ast.walk(ast.parse(source)):
+            if isinstance(noeud, (ast.FunctionDef, ast.AsyncFunctionDef)) and noeud.name == nom:
+                debut = noeud.decorator_list[0] if noeud.decorator_list else noeud
+                if debut.lineno + premiere_ligne - 1 == code.co_firstlineno:
+                    candidats.append(noeud)
+            elif isinstance(noeud, ast.Lambda) and nom == '<lambda>':
+                if hasattr(code, 'co_positions'):
+                    # la valeur retournée a la position du corps de la lambda
+                    if position(noeud.body) in set(code.co_positions()):
+                        candidats.append(noeud)
+                elif noeud.lineno + premiere_ligne - 1 == code.co_firstlineno:
+                    candidats.append(noeud)
+
+        if len(candidats) != 1:
+            raise _ExpressionNonSupportee('Définition de la fonction introuvable ou ambiguë')
+        return candidats[0]
+
+    def __corps(self, instructions):
+        # les affectations sont gardées en mémoire jusqu'au return final
+        for i, instruction in enumerate(instructions):
+            dernier = i == len(instructions) - 1
+            if isinstance(instruction, ast.Return) and dernier and instruction.value is not None:
+                return self.__expression(instruction.value)
+            elif isinstance(instruction, ast.Assign) and len(instruction.targets) == 1 \
+                    and isinstance(instruction.targets[0], ast.Name):
+                self.__affecter(instruction.targets[0].id, self.__expression(instruction.value))
+            elif isinstance(instruction, ast.AnnAssign) and instruction.value is not None \
+                    and isinstance(instruction.target, ast.Name):
+                self.__affecter(instruction.target.id, self.__expression(instruction.value))
+            elif isinstance(instruction, ast.AugAssign) and isinstance(instruction.target, ast.Name):
+                operation = self.__operateur(_OPERATEURS_BINAIRES, instruction.op)
+                valeur = operation(self.__nom(instruction.target.id),
+                                   self.__expression(instruction.value))
+                self.__affecter(instruction.target.id, valeur)
+            elif isinstance(instruction, ast.Expr) and isinstance(instruction.value, ast.Constant) \
+                    and isinstance(instruction.value.value, str):
+                continue  # docstring
+            elif isinstance(instruction, ast.Pass):
+                continue
+            else:
+                raise _ExpressionNonSupportee('Instruction non supportée : {0}'.format(
+                    type(instruction).__name__))
+        raise _ExpressionNonSupportee('La fonction doit se terminer par un return')
+
+    def __affecter(self, nom, valeur):
+        if nom == self.variable:
+            raise _ExpressionNonSupportee('La variable ne peut pas être réaffectée')
+        self.__locales[nom] = valeur
+
+    @staticmethod
+    def __operateur(operateurs, op):
+        try:
+            return operateurs[type(op)]
+        except KeyError:
+            raise _ExpressionNonSupportee('Opérateur non supporté : {0}'.format(type(op).__name__))
+
+    def __expression(self, noeud):
+        if isinstance(noeud, ast.Constant):
+            if isinstance(noeud.value, (bool, int, float, complex)):
+                return sm.sympify(noeud.value)
+            raise _ExpressionNonSupportee('Constante non supportée : {0!r}'.format(noeud.value))
+        elif isinstance(noeud, ast.Name):
+            return self.__nom(noeud.id)
+        elif isinstance(noeud, ast.Attribute):
+            return self.__constante(noeud.attr, self.__objet(noeud))
+        elif isinstance(noeud, ast.BinOp):
+            operation = self.__operateur(_OPERATEURS_BINAIRES, noeud.op)
+            return operation(self.__expression(noeud.left), self.__expression(noeud.right))
+        elif isinstance(noeud, ast.UnaryOp):
+            operation = self.__operateur(_OPERATEURS_UNAIRES, noeud.op)
+            return operation(self.__expression(noeud.operand))
+        elif isinstance(noeud, ast.Call):
+            return self.__appel(noeud)
+        raise _ExpressionNonSupportee('Expression non supportée : {0}'.format(type(noeud).__name__))
+
+    def __nom(self, nom):
+        if nom == self.variable:
+            return sm.Symbol(nom)
+        if nom in self.__locales:
+            return self.__locales[nom]
+        return self.__constante(nom, self.__objet(ast.Name(id=nom)))
+
+    def __objet(self, noeud):
+        # objet Python désigné par un nom ou une suite d'attributs
+        if isinstance(noeud, ast.Name):
+            if noeud.id == self.variable or noeud.id in self.__locales:
+                raise _ExpressionNonSupportee('{0} n\'est pas un objet'.format(noeud.id))
+            if noeud.id in self.__espace:
+                return self.__espace[noeud.id]
+            if hasattr(builtins, noeud.id):
+                return getattr(builtins, noeud.id)
+            raise _ExpressionNonSupportee('Nom inconnu : {0}'.format(noeud.id))
+        elif isinstance(noeud, ast.Attribute):
+            try:
+                return getattr(self.__objet(noeud.value), noeud.attr)
+            except AttributeError:
+                raise _ExpressionNonSupportee('Attribut inconnu : {0}'.format(noeud.attr))
+        raise _ExpressionNonSupportee('Objet non supporté : {0}'.format(type(noeud).__name__))
+
+    @staticmethod
+    def __constante(nom, valeur):
+        # les constantes pi et e sont gardées sous forme exacte
+        if isinstance(valeur, sm.Basic):
+            return valeur
+        if isinstance(valeur, (bool, int, float, complex, np.number)):
+            if nom == 'pi' and valeur == math.pi:
+                return sm.pi
+            if nom == 'e' and valeur == math.e:
+                return sm.E
+            return sm.sympify(valeur)
+        raise _ExpressionNonSupportee('{0} n\'est pas une constante numérique'.format(nom))
+
+    def __appel(self, noeud):
+        if noeud.keywords:
+            raise _ExpressionNonSupportee('Arguments nommés non supportés')
+        fonction = self.__objet(noeud.func)
+        arguments = [self.__expression(argument) for argument in noeud.args]
+
+        # autre fonction décorée : son expression est substituée
+        if isinstance(fonction, FonctionAnalytique1D):
+            analytique = fonction._expression_analytique()
+            if analytique is None or len(arguments) != 1:
+                raise _ExpressionNonSupportee('Fonction non analytique appelée')
+            variable, expression = analytique
+            return expression.subs(variable, arguments[0])
+
+        # fonction sympy
+        if isinstance(fonction, sm.FunctionClass) or \
+                getattr(fonction, '__module__', '') and fonction.__module__.startswith('sympy'):
+            return fonction(*arguments)
+
+        # fonction numérique connue
+        module = getattr(fonction, '__module__', None) or ''
+        if isinstance(fonction, np.ufunc) or module.split('.')[0] in _MODULES_NUMERIQUES:
+            nom = getattr(fonction, '__name__', None)
+            fonctions = _fonctions_sympy()
+            if nom in fonctions:
+                return fonctions[nom](*arguments)
+            raise _ExpressionNonSupportee('Fonction non supportée : {0}'.format(nom))
+
+        # autre fonction Python : traduite à son tour
+        if inspect.isfunction(fonction) and len(arguments) == 1:
+            compilateur = _CompilateurExpression(fonction, self.__profondeur + 1)
+            expression = compilateur.compiler()
+            return expression.subs(sm.Symbol(compilateur.variable), arguments[0])
+
+        raise _ExpressionNonSupportee('Appel non supporté : {0!r}'.format(fonction))
+
+
+def _resoudre(evaluer, deriver, a, b, N, tol, iterations_max):
+    """
+    Trouve les racines de evaluer dans [a, b] : les changements de
+    signe sont cherchés sur une grille de N + 1 points, puis tous
+    les intervalles sont raffinés ensemble par des pas de Newton
+    (avec la dérivée deriver), remplacés par une bissection quand
+    ils sortent de l'intervalle. Retourne les racines triées et,
+    pour chacune, si la fonction y est croissante
+    """
+    x = np.linspace(a, b, int(N) + 1)
+    y = evaluer(x)
+
+    # racines exactes sur la grille
+    exactes = np.nonzero(y == 0)[0]
+    croissantes_exactes = np.empty(len(exactes), bool)
+    for i, indice in enumerate(exactes):
+        voisins = y[max(indice - 1, 0):indice + 2]
+        croissantes_exactes[i] = voisins[-1] > voisins[0]
+
+    # intervalles avec un changement de signe
+    crochets = np.nonzero(np.sign(y[:-1]) * np.sign(y[1:]) < 0)[0]
+    bas, haut = x[crochets], x[crochets + 1]
+    f_bas = y[crochets]
+    croissantes = f_bas < 0
+
+    # départ : point de la fausse position
+    racines = bas - f_bas * (haut - bas) / (y[crochets + 1] - f_bas)
+    actifs = np.arange(len(racines))
+
+    for _ in range(int(iterations_max)):
+        if len(actifs) == 0:
+            break
+        r = racines[actifs]
+        f_r = evaluer(r)
+        d_r = np.broadcast_to(deriver(r), r.shape)
+
+        # l'intervalle est réduit du côté qui a le même signe que f(r)
+        meme_signe = np.sign(f_r) == np.sign(f_bas[actifs])
+        bas[actifs] = np.where(meme_signe, r, bas[actifs])
+        f_bas[actifs] = np.where(meme_signe, f_r, f_bas[actifs])
+        haut[actifs] = np.where(meme_signe, haut[actifs], r)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = r - f_r / d_r
+        dans_crochet = np.isfinite(newton) & (newton > bas[actifs]) & (newton < haut[actifs])
+        nouvelles = np.where(dans_crochet, newton, (bas[actifs] + haut[actifs]) / 2)
+        nouvelles = np.where(f_r == 0, r, nouvelles)
+
+        seuil = tol * (1 + np.abs(nouvelles))
+        termines = ((f_r == 0) | (np.abs(nouvelles - r) <= seuil) |
+                    (haut[actifs] - bas[actifs] <= seuil))
+        racines[actifs] = nouvelles
+        actifs = actifs[~termines]
+
+    racines = np.concatenate((x[exactes], racines))
+    croissantes = np.concatenate((croissantes_exactes, croissantes))
+    ordre = np.argsort(racines)
+    return racines[ordre], croissantes[ordre]
+
+
+def _integrer_morceau(fonction, methode, a, b, N):
+    """
+    Intègre une fonction sur un morceau [a, b] avec la méthode
+    nommée. Exécutée dans les processus de integration_parallele
+    """
+    return float(getattr(fonction, methode)(a, b, N))
+
 
 class FonctionAnalytique1D:
     """
@@ -27,6 +1520,11 @@ class FonctionAnalytique1D:
     ...     y = x**2
     ...     z = x + (y + 1)**2 + y * np.log(x)
     ...     return x + y + z
+    Pour une fonction coûteuse, les évaluations peuvent être gardées dans un
+    cache borné (indexé par la valeur exacte des points) :
+    >>> @FonctionAnalytique1D(cache=10000)
+    ... def ma_fonction(x):
+    ...     return solveur_couteux(x)
     Attributs :
         fonc : function
                 La fonction cible à traitée
@@ -36,40 +1534,58 @@ class FonctionAnalytique1D:
         SI ALIAS POUR LES IMPORTATIONS:
             numpy as np
             scipy.constant as cte
-        L'implémentation de la classe est toujours en progression. Les fonctions
-        qui dépendent d'une autre fonction implémentée par l'utilisateur ne
-        supportent pas les opérations symboliques (traitement analytique).
-        TODO : implémenter cette fonctionnalité
+        L'implémentation de la classe est toujours en progression. Une fonction
+        peut appeler une autre fonction décorée (ou une fonction Python simple) :
+        son expression est alors substituée dans l'expression symbolique.
     """
-    def __init__(self, fonc):
+    def _instrumente(methode):
+        # décorateur des méthodes mesurées par l'instrumentation (voir
+        # instrumenter). Sans instrumentation, la méthode est appelée directement
+        @functools.wraps(methode)
+        def enveloppe(self, *args, **kwargs):
+            if self.__instrumentation is None:
+                return methode(self, *args, **kwargs)
+            return self.__instrumentation.mesurer(methode, self, args, kwargs)
+        return enveloppe
+
+    def __new__(cls, fonc=None, cache=None):
+        # utilisation comme décorateur avec des options :
+        # @FonctionAnalytique1D(cache=...)
+        if fonc is None:
+            return lambda fonc: cls(fonc, cache=cache)
+        return super().__new__(cls)
+
+    def __init__(self, fonc, cache=None):
         """
-        La méthode __init__ permet d'initialisé les attributs et de découvrir si
-        les méthodes analytiques (symboliques) sont disponibles pour la fonction
+        La méthode __init__ permet d'initialisé les attributs. La découverte de
+        si les méthodes analytiques (symboliques) sont disponibles pour la fonction
+        est faite à la première utilisation d'une méthode analytique (voir warmup)
         Paramètres
         ===========
             fonc : function
                     La fonction cible à traitée
+            cache : int
+                    default : None
+                    Nombre maximal d'évaluations de la fonction gardées en
+                    mémoire (voir statistiques_cache). Si None, les
+                    évaluations ne sont pas gardées
         """
         # Attributs
         self.fonc = fonc  # objet function
 
-        # une liste des différentes chaines de caractères qu'il nous est possible de
-        # rencontrer (on veut éventuellement les changer par sm.[ ... ])
-        # TODO : stratégie à changer
-        self.possible_import = ['log', 'ln', 'log10', 'exp', 'pi', 'sin', 'cos', 'tan',
-                               'sinh', 'cosh', 'tanh', 'asin', 'acos','atan', 'asinh',
-                               'acosh', 'atanh', 'cot', 'acot', 'sec', 'asec', 'srqt',
-                               'power', 'csc', 'acsc', 'sinc', 'sech', 'asech', 'csch',
-                               'acsch', 'coth', 'acoth']
+        # évaluations de la fonction, indexées par la représentation binaire
+        # exacte du point (None si le cache n'est pas demandé)
+        self.__cache = CacheLRU(cache) if cache else None
 
-        self.__ana_variable = []  # liste : contient une string de la
-                                  # variable ou reste vide
+        self.__ana_variable = None  # string : nom de la variable, ou None
+                                    # s'il n'a pas été trouvé
 
-        self.__ana_fonction = []  # liste : contient une string de la
-                                  # variable ou reste vide
+        self.__ana_expression = None  # expression sympy de la fonction, ou None
+                                      # si elle n'a pas pu être construite
 
-        self.__ana = self.__si_analytique()  # Booleen : si la fonction peut être traitée
-                                             # de façon analytique
+        self.__ana = None  # Booleen : si la fonction peut être traitée de façon
+                           #           analytique (None tant que l'analyse
+                           #           n'est pas faite)
 
         self.fonc_originel = True  # Booleen : permet de savoir s'il s'agit de l'objet
                                    #           originel. Certaines méthodes retourne un
@@ -84,11 +1600,25 @@ class FonctionAnalytique1D:
         # à la première fois qu'on demande une intégration
         self.fonc_inte = None
 
+        self.__vectorisable = None  # Booleen : si self.fonc accepte un tableau numpy
+                                    #           en argument (None tant que ce n'est
+                                    #           pas vérifié)
+
+        self.__tour = None  # list : dérivées symboliques successives, partagée
+                            #        par l'objet originel et ses dérivées
+        self.__ordre = 0  # int : ordre de dérivation de l'objet dans self.__tour
+
+        self.__instrumentation = None  # Instrumentation : mesures, ou None si
+                                       # elles ne sont pas demandées (voir instrumenter)
+
     def __si_analytique(self):
         """
         ------------------------------------------------
         Méthode qui vise à déterminer si la fonction
-        peut être traité de façon analytique
+        peut être traité de façon analytique. Le code
+        source de la fonction est traduit en expression
+        sympy (voir _CompilateurExpression), qui est
+        gardée sur l'objet
         ------------------------------------------------
         Retourne
         ============
@@ -96,111 +1626,142 @@ class FonctionAnalytique1D:
             Résultat de si la fonction peut être traitée comme
             une fonction analytique
         """
-        source = inspect.getsourcelines(self.fonc)[0]  # code source
+        compilateur = _CompilateurExpression(self.fonc)
+        try:
+            with _etape('analyse'):
+                self.__ana_expression = compilateur.compiler()
+            return True
+        except Exception:
+            return False
+        finally:
+            self.__ana_variable = compilateur.variable
+
+    def __est_analytique(self):
+        """
+        ------------------------------------------------
+        Retourne si la fonction peut être traitée de
+        façon analytique. L'analyse n'est faite qu'à
+        la première demande, puis son résultat est gardé
+        ------------------------------------------------
+        """
+        if self.__ana is None:
+            self.__ana = self.__si_analytique()
+        return self.__ana
 
-        # on retire tout les espaces blancs sur les contours
-        for i in range(len(source)):
-            source[i] = source[i].strip()
+    @_instrumente
+    def warmup(self):
+        """
+        ------------------------------------------------
+        Fait immédiatement l'analyse symbolique de la
+        fonction, qui est sinon faite à la première
+        utilisation d'une méthode analytique
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : FonctionAnalytique1D
+            L'objet lui-même
+        """
+        self.__est_analytique()
+        return self
 
-        # on trouve où commence la fonction def (il pourait y avoir plusieurs décorateurs)
-        for i in range(len(source)):
-            if source[i][:3] == 'def':
-                source = source[i:]
-                break
+    @staticmethod
+    def warmup_lot(fonctions, max_workers=None):
+        """
+        ------------------------------------------------
+        Fait l'analyse symbolique de plusieurs fonctions
+        (voir warmup), optionnellement dans un groupe
+        de fils d'exécution
+        ------------------------------------------------
+        Paramètres
+        ============
+        fonctions : iterable de FonctionAnalytique1D
+            Les fonctions à analyser
+        max_workers : int
+            default : None
+            Nombre de fils d'exécution. Si None, les fonctions
+            sont analysées l'une après l'autre
+        Retourne
+        ============
+        résultat : list de bool
+            Pour chaque fonction, si elle supporte les méthodes
+            analytiques
+        """
+        fonctions = list(fonctions)
+        if max_workers is None:
+            return [fonction.warmup().__est_analytique() for fonction in fonctions]
 
-        try:
-            # Détection des variables
-            #--------------------------------------------------
-            variable = source[0].split('(')[1]
-            indice_fin_variable = 0
-            for i in range(len(variable)):
-                if variable[i] == ')' or variable[i] == ',':
-                    indice_fin_variable = i
-                    break
-
-            if indice_fin_variable == 0:
-                raise TypeError('Erreur dans la détection des variables')
-
-            # notre variable
-            variable = variable[:indice_fin_variable]
-
-            # la variable est stocké
-
-            self.__ana_variable.append(variable)
-
-            # Détection de la fonction
-            # --------------------------------------------------
-            if len(source) == 2:
-                # Pour les fonctions à deux lignes
-                # manipulation de la chaine de caratere
-                fonction = source[1].split('return ')[1]
-                fonction = fonction.replace('np.', 'sm.')
-                fonction = fonction.replace('numpy.', 'sm.')
-                for i in self.possible_import:
-                    string_temp = i + '('
-                    if (string_temp in fonction) and not ('.'+string_temp in fonction):
-                        fonction = fonction.replace(string_temp, 'sm.'+string_temp)
-                self.__ana_fonction.append(fonction)
-            else:
-                # Pour les fonctions à plusieurs lignes
-                # manipulation de la chaine de caractères
-                elements_temp = []
-                for i in source[:-1]:
-                    if '=' in i:
-                        element_temp = i.split('=')
-                        if len(element_temp) == 2:
-                            if not '(' in element_temp:
-                                element_1 = element_temp[0].strip()
-                                element_2 = element_temp[1].strip()
-                                elements_temp.append([element_1, '('+element_2+')'])
-
-                elements_temp = elements_temp[::-1]
-                fonction = source[-1].split('return ')[1]
-                for i in elements_temp:
-                    if i[0] in fonction:
-                        fonction = fonction.replace(i[0], i[1])
-                fonction = fonction.replace('np.', 'sm.')
-                fonction = fonction.replace('numpy.', 'sm.')
-                # si la fonction a des dépendance de d'autre fonctions
-                # implémentées
-                elements_charges = globals().keys()
-                elements_barrieres = ['+', '-', '*', '/', '%', ' ']
-                elements_presents = []
-                for i in elements_charges:
-                    for j in elements_barrieres:
-                        if j+i+'('+variable+')' in fonction:
-                            print(i)
-                            if type(eval(i)) == FonctionAnalytique1D:
-                                fonction = fonction.replace((i+'({0})'.format(variable),
-                                                            eval(i).__ana_fonction))
-
-                # une liste des différentes chaines de caractères qu'il
-                # nous est possible de
-                # rencontrer (on veut éventuellement les changer par sm.[ ... ])
-                for i in self.possible_import:
-                    string_temp = i + '('
-                    if (string_temp in fonction) and not ('.'+string_temp in fonction):
-                        fonction = fonction.replace(string_temp, 'sm.'+string_temp)
-
-                self.__ana_fonction.append(fonction)
-
-            # on test différentes combinaisons pour voir si la fonction
-            # peut être évaluée (au cas où l'utilisateur retourne des
-            # choses étranges)
-            vrai_ou_faux = True
-            valeurs_test = [0.4, 0, 1, -1, -0.4]
-            for valeur_test in valeurs_test:
-                try:
-                    exec("{0} = {1}".format(self.__ana_variable[0], valeur_test))
-                    complex(eval(self.__ana_fonction[0]))
-                    vrai_ou_faux = True
-                    break
-                except:
-                    vrai_ou_faux = False
-            return vrai_ou_faux
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executeur:
+            return [fonction.__est_analytique() for fonction in
+                    executeur.map(FonctionAnalytique1D.warmup, fonctions)]
 
-        except:
-            return False
+    def _expression_analytique(self):
+        """
+        ------------------------------------------------
+        Retourne le symbole de la variable et l'expression
+        sympy de la fonction, ou None si la fonction ne
+        supporte pas les méthodes analytiques
+        ------------------------------------------------
+        """
+        if not self.__est_analytique():
+            return None
+        return sm.Symbol(self.__ana_variable), self.__ana_expression
+
+    def __nouvel_objet(self, expression, tour, ordre):
+        """
+        ------------------------------------------------
+        Construit l'objet FonctionAnalytique1D retourné
+        par les méthodes analytiques. L'objet partage la
+        variable et la tour des dérivées plutôt que
+        d'être une copie de l'objet courant
+        ------------------------------------------------
+        """
+        variable = sm.Symbol(self.__ana_variable)
+        nouveau = FonctionAnalytique1D(_compiler_fonction(variable, expression))
+        nouveau.__ana_variable = self.__ana_variable
+        nouveau.__ana_expression = expression
+        nouveau.__ana = True
+        nouveau.__tour = tour
+        nouveau.__ordre = ordre
+        nouveau.fonc_originel = False
+        nouveau.__instrumentation = self.__instrumentation
+        return nouveau
+
+    @_instrumente
+    def tour_derivees(self, n):
+        """
+        ------------------------------------------------
+        Retourne les expressions symboliques de la
+        fonction et de ses n premières dérivées. Chaque
+        ordre est calculé à partir du précédent, puis
+        gardé : les objets retournés par ana_derive
+        partagent la même tour
+        ------------------------------------------------
+        Paramètres
+        ============
+        n : int
+            Ordre de dérivation maximal
+        Retourne
+        ============
+        résultat : list d'expressions sympy | None si la fonction
+                   ne supporte pas les méthodes analytiques
+            [f, f', f'', ..., f^(n)]
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return sin(x)
+        >>> ma_fonction.tour_derivees(2)
+        [sin(x), cos(x), -sin(x)]
+        """
+        if not self.__est_analytique():
+            return None
+        if self.__tour is None:
+            self.__tour = [self.__ana_expression]
+
+        variable = sm.Symbol(self.__ana_variable)
+        while len(self.__tour) <= self.__ordre + n:
+            self.__tour.append(_operation_symbolique('derive', self.__tour[-1], variable))
+        return self.__tour[self.__ordre:self.__ordre + n + 1]
 
     def ana_information(self):
         """
@@ -209,13 +1770,13 @@ class FonctionAnalytique1D:
         analytique de la fonction
         ------------------------------------------------
         """
-        if self.__ana:
-            print('Variable : ', self.__ana_variable[0])
-            print('Fonction : ', self.__ana_fonction[0])
-            return self.__ana_fonction[0]
+        if self.__est_analytique():
+            print('Variable : ', self.__ana_variable)
+            print('Fonction : ', self.__ana_expression)
+            return str(self.__ana_expression)
         else:
-            print('Variable trouvée : ', self.__ana_variable[0])
-            print('Fonction trouvée : ', self.__ana_fonction[0])
+            print('Variable trouvée : ', self.__ana_variable)
+            print('Fonction trouvée : ', self.__ana_expression)
             self.si_analytique()
 
     def si_analytique(self):
@@ -231,7 +1792,7 @@ class FonctionAnalytique1D:
                     Résultat sur si oui ou non la fonction peut
                     être traitée comme une fonction analytique
         """
-        if not self.__ana:
+        if not self.__est_analytique():
             print('La fonction ne supporte pas les méthodes analytiques')
             print('Formatage de inadéquat de la fonction :')
             print(inspect.getsource(self.fonc))
@@ -244,7 +1805,8 @@ class FonctionAnalytique1D:
             print('La fonction supporte les méthodes analytiques')
             return True
 
-    def ana_derive(self, verbeux=False, latex=False):
+    @_instrumente
+    def ana_derive(self, verbeux=False, latex=False, ordre=1):
         """
         ------------------------------------------------
         ------- Méthode de dérivation analytique -------
@@ -262,6 +1824,10 @@ class FonctionAnalytique1D:
             True si l'utilisateur veut retourner une
             chaine de caractère en latex de l'expression
             dérivée
+        ordre : int
+            default : 1
+            Ordre de la dérivée. Les ordres intermédiaires
+            sont gardés (voir tour_derivees)
         Retourne
         ============
         résultat : si latex=False | FonctionAnalytique1D
@@ -279,43 +1845,31 @@ class FonctionAnalytique1D:
         TODO
         """
         # si la fonction ne supporte pas le traitement analytique
-        if not self.__ana:
+        if not self.__est_analytique():
             self.si_analytique()
             return None
-        # instance de la variable symbolique
-        exec("{0} = sm.Symbol('{0}')".format(self.__ana_variable[0]))
-        variable = eval('{0}'.format(self.__ana_variable[0]))
+        if ordre < 1:
+            raise ValueError('L\'ordre de la dérivée doit être au moins 1')
+        variable = sm.Symbol(self.__ana_variable)
 
-        try:
-            # derivation
-            expression = eval(self.__ana_fonction[0])
-            resultat_derive = sm.simplify(expression.diff(variable))
-            self.fonc_deriv = sm.lambdify(variable, resultat_derive)
+        # derivation, à partir des ordres déjà calculés
+        tour = self.tour_derivees(ordre)
+        resultat_derive = tour[ordre]
+        self.fonc_deriv = _compiler_fonction(variable, tour[1])
 
-            if verbeux:
-                print("Le résultat de sa dérivée est : ")
-                sm.pprint(resultat_derive)
+        if verbeux:
+            print("Le résultat de sa dérivée est : ")
+            sm.pprint(resultat_derive)
 
-            if latex:
-                return sm.latex(resultat_derive)
-            else:
-                # retourne un objet FonctionAnalytique1D avec la fonction
-                # dérivée comme attribut self.fonc et self.__ana_fonction
-                nouveau = copy.deepcopy(self)
-                nouveau.fonc = sm.lambdify(variable, resultat_derive)
-                fonction_string = str(resultat_derive)
-                for i in self.possible_import:
-                    if i in fonction_string:
-                        fonction_string = fonction_string.replace(i, 'sm.'+i)
-                nouveau.__ana_fonction[0] = fonction_string
-                nouveau.fonc_originel = False
-                return nouveau
-        except NameError:
-            raise NameError('Échec de l\'opération. '
-                            'Peut être que la fonction à un argument en trop '
-                            '(NON SUPPORTÉ)')
-
-    def ana_integration_non_def(self, verbeux=False, latex=False):
+        if latex:
+            return sm.latex(resultat_derive)
+        else:
+            # retourne un objet FonctionAnalytique1D avec la fonction
+            # dérivée comme attribut self.fonc et self.__ana_expression
+            return self.__nouvel_objet(resultat_derive, self.__tour, self.__ordre + ordre)
+
+    @_instrumente
+    def ana_integration_non_def(self, verbeux=False, latex=False, timeout=None, simplifier=True):
         """
         ------------------------------------------------
         ------- Méthode d'intégration analytique -------
@@ -333,6 +1887,15 @@ class FonctionAnalytique1D:
             True si l'utilisateur veut retourner une
             chaine de caractère en latex de l'expression
             intégrée
+        timeout : float
+            default : None
+            Durée maximale (s) de l'intégration symbolique, faite
+            alors dans un sous-processus terminé au besoin
+            (TimeoutError si elle est dépassée)
+        simplifier : bool ou 'rapide'
+            default : True
+            Simplification du résultat : sm.simplify (True),
+            sm.cancel ('rapide') ou aucune (False)
         Retourne
         ============
         résultat : si latex=False | FonctionAnalytique1D
@@ -342,6 +1905,7 @@ class FonctionAnalytique1D:
                                     sous la forme d'une chaine de caractère latex
                  : si l'attribut  | self.__ana = False | None
                                     Retroune l'objet None
+                 : si l'intégrale n'est pas évaluée par sympy | None
         Exemple
         ============
         >>> @FonctionAnalytique1D
@@ -350,44 +1914,37 @@ class FonctionAnalytique1D:
         TODO
         """
         # si la fonction ne supporte pas le traitement analytique
-        if not self.__ana:
+        if not self.__est_analytique():
             self.si_analytique()
             return None
-        # instance de la variable symbolique
-        exec("{0} = sm.Symbol('{0}')".format(self.__ana_variable[0]))
-        variable = eval('{0}'.format(self.__ana_variable[0]))
+        # variable symbolique et expression de la fonction
+        variable = sm.Symbol(self.__ana_variable)
+        expression = self.__ana_expression
+
+        # integration non definie
+        resultat_inte = _operation_symbolique('integre', expression, variable,
+                                              timeout, simplifier)
+        evaluee = not resultat_inte.has(sm.Integral)
+        if evaluee:
+            self.fonc_inte = _compiler_fonction(variable, resultat_inte)
+
+        if verbeux:
+            print("Le résultat de l'intégrale non définie est : ")
+            sm.pprint(resultat_inte)
+
+        if latex:
+            # retourne le code sous forme de code latex
+            return sm.latex(resultat_inte)
+        elif not evaluee:
+            print("L'intégrale n'a pas pu être évaluée de façon symbolique")
+            return None
+        else:
+            # retourne un objet FonctionAnalytique1D avec la fonction
+            # intégrée comme attribut self.fonc et self.__ana_expression
+            return self.__nouvel_objet(resultat_inte, [resultat_inte], 0)
 
-        try:
-            # integration non definie
-            expression = eval(self.__ana_fonction[0])
-            resultat_inte = sm.simplify(sm.integrate(expression, variable))
-            self.fonc_inte = sm.lambdify(variable, resultat_inte)
-
-            if verbeux:
-                print("Le résultat de l'intégrale non définie est : ")
-                sm.pprint(resultat_inte)
-
-            if latex:
-                # retourne le code sous forme de code latex
-                return sm.latex(resultat_inte)
-            else:
-                # retourne un objet FonctionAnalytique1D avec la fonction
-                # intégrée comme attribut self.fonc et self.__ana_fonction
-                nouveau = copy.deepcopy(self)
-                nouveau.fonc = sm.lambdify(variable, resultat_inte)
-                fonction_string = str(resultat_inte)
-                for i in self.possible_import:
-                    if i in fonction_string:
-                        fonction_string = fonction_string.replace(i, 'sm.'+i)
-                nouveau.__ana_fonction[0] = fonction_string
-                nouveau.fonc_originel = False
-                return nouveau
-
-        except NameError:
-            raise NameError('Échec de l\'opération. '
-                            'Peut être que la fonction à un argument en trop '
-                            '(NON SUPPORTÉ)')
 
+    @_instrumente
     def ana_derive_a(self, a, verbeux=False):
         """
         ------------------------------------------------
@@ -417,52 +1974,46 @@ class FonctionAnalytique1D:
         TODO
         """
         # si la fonction ne supporte pas le traitement analytique
-        if not self.__ana:
+        if not self.__est_analytique():
             self.si_analytique()
             return None
 
         elif self.fonc_deriv is not None and not verbeux:
             return self.fonc_deriv(a)
 
-        try:
-            # instance de la variable symbolique
-            exec("{0} = sm.Symbol('{0}')".format(self.__ana_variable[0]))
-            variable = eval('{0}'.format(self.__ana_variable[0]))
-
-            # derivation
-            expression = eval(self.__ana_fonction[0])
-            resultat_derive = sm.simplify(expression.diff(variable))
-            self.fonc_deriv = sm.lambdify(variable, resultat_derive)
-
-            if verbeux:
-                print('La fonction est la suivante :')
-                sm.pprint(self.__ana_fonction[0])
-                print("\nLe résultat de la dérivée non évaluée est : ")
-                sm.pprint(resultat_derive)
-
-            # résultat de la dérivée définie
-            resultat_derive_evaluee = resultat_derive.subs(variable, a)
-
-            # affichage d'étape de calcul
-            if verbeux:
-                print("\nLe résultat de la dérivée évaluée est : ")
-                sm.pprint(resultat_derive_evaluee)
-
-            # si le résultat est un complex, retourne un complex
-            # sinon retourne un float
-            try:
-                resultat = complex(resultat_derive_evaluee.evalf())
-                assert resultat.imag
-                return resultat
-            except:
-                return float(resultat_derive_evaluee.evalf())
-        except NameError:
-            raise NameError('Échec de l\'opération. '
-                            'Peut être que la fonction à un argument en trop '
-                            '(NON SUPPORTÉ)')
+        # variable symbolique et expression de la fonction
+        variable = sm.Symbol(self.__ana_variable)
+        expression, resultat_derive = self.tour_derivees(1)
+
+        # derivation
+        self.fonc_deriv = _compiler_fonction(variable, resultat_derive)
+
+        if verbeux:
+            print('La fonction est la suivante :')
+            sm.pprint(expression)
+            print("\nLe résultat de la dérivée non évaluée est : ")
+            sm.pprint(resultat_derive)
 
+        # résultat de la dérivée définie
+        resultat_derive_evaluee = resultat_derive.subs(variable, a)
+
+        # affichage d'étape de calcul
+        if verbeux:
+            print("\nLe résultat de la dérivée évaluée est : ")
+            sm.pprint(resultat_derive_evaluee)
+
+        # si le résultat est un complex, retourne un complex
+        # sinon retourne un float
+        try:
+            resultat = complex(resultat_derive_evaluee.evalf())
+            assert resultat.imag
+            return resultat
+        except:
+            return float(resultat_derive_evaluee.evalf())
 
-    def ana_integration_def(self, a, b, verbeux=False):
+    @_instrumente
+    def ana_integration_def(self, a, b, verbeux=False, timeout=None, simplifier=True,
+                            methode_numerique='gauss_kronrod'):
         """
         ------------------------------------------------
         ------- Méthode d'intégration analytique -------
@@ -479,6 +2030,25 @@ class FonctionAnalytique1D:
             default : False
             True si l'utilisateur veut l'affichage
             d'information sur l'intégration
+        timeout : float
+            default : None
+            Durée maximale (s) de l'intégration symbolique, faite
+            alors dans un sous-processus terminé au besoin
+        simplifier : bool ou 'rapide'
+            default : True
+            Simplification de la primitive : sm.simplify (True),
+            sm.cancel ('rapide') ou aucune (False)
+        methode_numerique : str
+            default : 'gauss_kronrod'
+            Méthode d'intégration numérique utilisée si l'intégration
+            symbolique dépasse timeout, échoue, retourne une intégrale
+            non évaluée ou un résultat non fini (ex. 'gauss_kronrod',
+            'double_exponentielle', 'romberg', 'simpson'). Si une borne
+            est infinie, 'double_exponentielle' est utilisée. Un
+            avertissement est émis si le résultat numérique n'est pas
+            fini ou si son erreur estimée dépasse la tolérance de la
+            méthode. Si None, l'erreur est levée (ou le résultat non
+            fini est retourné)
         Retourne
         ============
         résultat : complex ou float
@@ -492,51 +2062,222 @@ class FonctionAnalytique1D:
         TODO
         """
         # si la fonction ne supporte pas le traitement analytique
-        if not self.__ana:
+        if not self.__est_analytique():
             self.si_analytique()
             return None
 
         elif self.fonc_inte is not None and not verbeux:
-            return self.fonc_inte(b) - self.fonc_inte(a)
+            resultat = self.fonc_inte(b) - self.fonc_inte(a)
+            if methode_numerique is None or np.all(np.isfinite(resultat)):
+                return resultat
+            return self.__integration_numerique(a, b, methode_numerique, verbeux)
 
+        # variable symbolique et expression de la fonction
+        variable = sm.Symbol(self.__ana_variable)
+        expression = self.__ana_expression
+
+        # integration non definie
         try:
-            # instance de la variable symbolique
-            exec("{0} = sm.Symbol('{0}')".format(self.__ana_variable[0]))
-            variable = eval('{0}'.format(self.__ana_variable[0]))
-
-            # integration non definie
-            expression = eval(self.__ana_fonction[0])
-            resultat_inte = sm.simplify(sm.integrate(expression, variable))
-            self.fonc_inte = sm.lambdify(variable, resultat_inte)
-
-            if verbeux:
-                print('La fonction est la suivante :')
-                sm.pprint(self.__ana_fonction[0])
-                print("\nLe résultat de l'intégrale non définie est : ")
-                sm.pprint(resultat_inte)
-
-            # résultat de l'intégrale définie
-            borne_inf_inte_definie = resultat_inte.subs(variable, a)
-            borne_sup_inte_definie = resultat_inte.subs(variable, b)
-            resultat_integrale_definie = borne_sup_inte_definie - borne_inf_inte_definie
-
-            # affichage d'étape de calcul
-            if verbeux:
-                print("\nLe résultat de l'intégrale définie est : ")
-                sm.pprint(resultat_integrale_definie)
-
-            # si le résultat est un complex, retourne un complex
-            # sinon retourne un float
-            resultat = complex(resultat_integrale_definie.evalf())
-            if resultat.imag == 0.0:
-                return float(resultat_integrale_definie.evalf())
-            return resultat
-        except NameError:
-            raise NameError('Échec de l\'opération. '
-                            'Peut être que la fonction à un argument en trop '
-                            '(NON SUPPORTÉ)')
+            resultat_inte = _operation_symbolique('integre', expression, variable,
+                                                  timeout, simplifier)
+        except (TimeoutError, RuntimeError, NotImplementedError):
+            # délai dépassé, échec du sous-processus ou abandon de sympy
+            if methode_numerique is None:
+                raise
+            return self.__integration_numerique(a, b, methode_numerique, verbeux)
+
+        if resultat_inte.has(sm.Integral) and methode_numerique is not None:
+            # sympy n'a pas trouvé de primitive
+            return self.__integration_numerique(a, b, methode_numerique, verbeux)
+        self.fonc_inte = _compiler_fonction(variable, resultat_inte)
+
+        if verbeux:
+            print('La fonction est la suivante :')
+            sm.pprint(expression)
+            print("\nLe résultat de l'intégrale non définie est : ")
+            sm.pprint(resultat_inte)
+
+        # résultat de l'intégrale définie
+        borne_inf_inte_definie = resultat_inte.subs(variable, a)
+        borne_sup_inte_definie = resultat_inte.subs(variable, b)
+        resultat_integrale_definie = borne_sup_inte_definie - borne_inf_inte_definie
+
+        # affichage d'étape de calcul
+        if verbeux:
+            print("\nLe résultat de l'intégrale définie est : ")
+            sm.pprint(resultat_integrale_definie)
+
+        # si le résultat est un complex, retourne un complex
+        # sinon retourne un float
+        resultat = complex(resultat_integrale_definie.evalf())
+        if not cmath.isfinite(resultat) and methode_numerique is not None:
+            # ex. primitive non définie à une borne (x*log(x) en 0)
+            return self.__integration_numerique(a, b, methode_numerique, verbeux)
+        if resultat.imag == 0.0:
+            return float(resultat_integrale_definie.evalf())
+        return resultat
+
+    def __integration_numerique(self, a, b, methode, verbeux):
+        """
+        ------------------------------------------------
+        Intégration numérique de remplacement pour
+        ana_integration_def, avec la méthode nommée
+        (paramètres par défaut de la méthode)
+        ------------------------------------------------
+        """
+        if not (np.isfinite(a) and np.isfinite(b)):
+            # seule méthode qui accepte les intervalles infinis
+            methode = 'double_exponentielle'
+        if verbeux:
+            print("Intégration symbolique abandonnée, intégration numérique "
+                  "({0})".format(methode))
+        integrer = getattr(self, methode)
+        resultat = integrer(a, b)
+        erreur = None
+        if isinstance(resultat, tuple):
+            # méthodes adaptatives : (valeur, erreur, nb_evaluations)
+            resultat, erreur = resultat[0], resultat[1]
+
+        resultat = complex(resultat)
+        if not cmath.isfinite(resultat):
+            warnings.warn("Le résultat de l'intégration numérique ({0}) n'est pas "
+                          "fini".format(methode), RuntimeWarning, stacklevel=4)
+        elif erreur is not None:
+            # comparée aux tolérances par défaut de la méthode, si elle en a
+            parametres = inspect.signature(integrer).parameters
+            tolerance = np.inf
+            if 'tol_abs' in parametres and 'tol_rel' in parametres:
+                tolerance = max(parametres['tol_abs'].default,
+                                parametres['tol_rel'].default * abs(resultat))
+            elif 'tol' in parametres and parametres['tol'].default is not None:
+                tolerance = parametres['tol'].default
+            if not erreur <= tolerance:
+                warnings.warn("L'erreur estimée de l'intégration numérique ({0}) est "
+                              "{1:.3g}, au-delà de la tolérance".format(methode, erreur),
+                              RuntimeWarning, stacklevel=4)
+
+        # si le résultat est un complex, retourne un complex
+        # sinon retourne un float
+        if resultat.imag == 0.0:
+            return resultat.real
+        return resultat
+
+    def __evaluer(self, x):
+        """
+        ------------------------------------------------
+        Évalue la fonction sur un tableau de points.
+        La fonction est appelée une seule fois sur le
+        tableau complet si elle le supporte, sinon elle
+        est appelée point par point. Si le cache est
+        activé, seuls les points qui n'y sont pas sont
+        évalués
+        ------------------------------------------------
+        Paramètres
+        ============
+        x : numpy.ndarray
+            Points auxquels la fonction est évaluée
+        Retourne
+        ============
+        résultat : numpy.ndarray
+            Valeurs de la fonction, de même forme que x
+        """
+        x = np.asarray(x)
+        if self.__cache is not None and x.dtype.kind in 'iuf':
+            return self.__evaluer_cache(x)
+        return self.__evaluer_fonction(x)
 
-    def trapeze(self, a, b, N=100):
+    def __evaluer_cache(self, x):
+        """
+        ------------------------------------------------
+        Évalue la fonction en passant par le cache des
+        évaluations. Les points sont identifiés par leur
+        représentation binaire exacte
+        ------------------------------------------------
+        """
+        x = np.asarray(x, dtype=np.float64)
+        points = x.ravel()
+        cles = points.view(np.uint64).tolist()
+
+        valeurs = [self.__cache.obtenir(cle, CacheLRU._ABSENT) for cle in cles]
+        manquants = {}  # clé -> indice, chaque point manquant n'est évalué qu'une fois
+        for i, (cle, valeur) in enumerate(zip(cles, valeurs)):
+            if valeur is CacheLRU._ABSENT:
+                manquants.setdefault(cle, i)
+
+        if manquants:
+            indices = list(manquants.values())
+            nouvelles = self.__evaluer_fonction(points[indices])
+            for cle, valeur in zip(manquants, nouvelles.tolist()):
+                self.__cache.ajouter(cle, valeur)
+                manquants[cle] = valeur
+            valeurs = [manquants[cle] if valeur is CacheLRU._ABSENT else valeur
+                       for cle, valeur in zip(cles, valeurs)]
+
+        return np.array(valeurs).reshape(x.shape)
+
+    def __evaluer_fonction(self, x):
+        """
+        ------------------------------------------------
+        Évalue directement self.fonc sur un tableau de
+        points (voir __evaluer)
+        ------------------------------------------------
+        """
+        if self.__vectorisable is not False:
+            try:
+                y = np.asarray(self.fonc(x))
+                if y.ndim == 0:
+                    # fonction constante
+                    y = np.full(x.shape, y[()])
+                elif y.shape != x.shape:
+                    raise ValueError('Forme du résultat inadéquate')
+                if x.size > 1:
+                    # un seul point ne permet pas de conclure (ex. fonction
+                    # avec une condition sur x)
+                    self.__vectorisable = True
+                if self.__instrumentation is not None:
+                    self.__instrumentation.compter(x.size)
+                return y
+            except Exception:
+                # une fonction qui a déjà accepté un tableau lève une vraie erreur
+                if self.__vectorisable:
+                    raise
+                self.__vectorisable = False
+
+        # évaluation point par point (fonctions qui n'acceptent pas de tableau)
+        if self.__instrumentation is not None:
+            self.__instrumentation.compter(x.size)
+        y = np.array([self.fonc(x_i) for x_i in x.ravel()])
+        return y.reshape(x.shape)
+
+    def __trapezes_emboites(self, a, b, N):
+        """
+        ------------------------------------------------
+        Générateur des intégrales par la méthode du
+        trapèze sur N, 2N, 4N, ... trapèzes. Chaque
+        raffinement n'évalue que les nouveaux points
+        milieux et réutilise tous les points précédents
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : générateur de tuple (int, float, int)
+            Nombre de trapèzes, intégrale et nombre total
+            d'évaluations de la fonction
+        """
+        h = (b - a) / N
+        y = self.__evaluer(a + h * np.arange(N + 1))
+        trapeze = h * ((y[0] + y[-1]) / 2 + y[1:-1].sum())
+        nb_evaluations = N + 1
+
+        while True:
+            yield N, trapeze, nb_evaluations
+            h /= 2
+            milieux = a + h * np.arange(1, 2 * N, 2)
+            trapeze = trapeze / 2 + h * self.__evaluer(milieux).sum()
+            nb_evaluations += N
+            N *= 2
+
+    @_instrumente
+    def trapeze(self, a, b, N=100, tol=None, N_max=2**20):
         """
         ------------------------------------------------
         ------- Méthode d'intégration numérique --------
@@ -552,10 +2293,22 @@ class FonctionAnalytique1D:
         N : int
             default : 100
             Nombre de trapèzes utilisé pour l'intégration
+            (nombre initial si tol est donnée)
+        tol : float
+            default : None
+            Si donnée, N est doublé (seuls les nouveaux points
+            sont évalués) jusqu'à ce que l'estimation de l'erreur,
+            |T(2N) - T(N)| / 3, soit inférieure à tol
+        N_max : int
+            default : 2**20
+            Nombre maximal de trapèzes si tol est donnée
         Retourne
         ============
         résultat : float
             Résultat de l'intégrale par la méthode du trapèze
+                 : si tol est donnée | tuple (float, int, float, int)
+            Résultat, nombre de trapèzes utilisé, estimation
+            de l'erreur et nombre d'évaluations de la fonction
         Exemple
         ============
         >>> @FonctionAnalytique1D
@@ -563,19 +2316,31 @@ class FonctionAnalytique1D:
                 return x**2
         >>> ma_fonction.trapeze(a=1.24, b=2, N=1000)
         2.031125406495998
+        >>> ma_fonction.trapeze(a=1.24, b=2, N=8, tol=1e-8)
+        (2.031125337694168, 4096, 4.360834804373326e-09, 4097)
         """
         # Paramètres
         N = int(N)
+        if tol is not None:
+            trapezes = self.__trapezes_emboites(a, b, N)
+            _, precedent, _ = next(trapezes)
+            for N, trapeze, nb_evaluations in trapezes:
+                # l'erreur de la méthode du trapèze est en h**2
+                erreur = abs(trapeze - precedent) / 3
+                if erreur <= tol or 2 * N > N_max:
+                    return trapeze, N, erreur, nb_evaluations
+                precedent = trapeze
+
         h = (b - a) / N  # largeur de chaque division
-        resultat_sum = 0  # variable sur laquelle toute les aires sont additionnées
 
-        # Sommation
-        for i in range(1, N+1):
-            resultat_sum += self.fonc(a + h * (i-1)) + self.fonc(a + h * i)
+        # évaluation de tous les noeuds en un seul appel
+        y = self.__evaluer(a + h * np.arange(N + 1))
 
-        return h / 2 * resultat_sum
+        # Sommation (les noeuds intérieurs sont partagés par deux trapèzes)
+        return h * ((y[0] + y[-1]) / 2 + y[1:-1].sum())
 
-    def simpson(self, a, b, N=100):
+    @_instrumente
+    def simpson(self, a, b, N=100, tol=None, N_max=2**20):
         """
         ------------------------------------------------
         ------- Méthode d'intégration numérique --------
@@ -591,10 +2356,22 @@ class FonctionAnalytique1D:
         N : int
             default : 100
             Nombre de sous-divisions utilisé pour l'intégration
+            (nombre initial si tol est donnée)
+        tol : float
+            default : None
+            Si donnée, N est doublé (seuls les nouveaux points
+            sont évalués) jusqu'à ce que l'estimation de l'erreur,
+            |S(2N) - S(N)| / 15, soit inférieure à tol
+        N_max : int
+            default : 2**20
+            Nombre maximal de sous-divisions si tol est donnée
         Retourne
         ============
         résultat : float
             Résultat de l'intégrale par la méthode de Simpson
+                 : si tol est donnée | tuple (float, int, float, int)
+            Résultat, nombre de sous-divisions utilisé, estimation
+            de l'erreur et nombre d'évaluations de la fonction
         Exemple
         =============
         >>> import numpy as np
@@ -606,59 +2383,602 @@ class FonctionAnalytique1D:
         ----------------------------------------------
         La réponse exacte étant racine de pi soit 1.77245385091 arrondie.
         """
-        # Paramètres
-        N = int(N)
-        h = (b - a) / N  # Largeur des subdivisions
-        somme_paire = 0  # Sommation paire
-        somme_impaire = 0  # Sommation impaire
-
-        # Sommation paire
-        for i in range(2, N, 2):
-            somme_paire += self.fonc(a + i*h)
-
-        # Sommation impaire
-        for i in range(1, N, 2):
-            somme_impaire += self.fonc(a + i*h)
-
-        return (h / 3) * (self.fonc(a) + 2 * somme_paire +\
-                4 * somme_impaire + self.fonc(b))
-
-    def romberg_naive(self, a, b, n, m):
+        # Paramètres
+        N = int(N)
+        if tol is not None:
+            # S(2N) = (4 T(2N) - T(N)) / 3, avec T la méthode du trapèze
+            trapezes = self.__trapezes_emboites(a, b, max(1, (N + 1) // 2))
+            _, trapeze_precedent, _ = next(trapezes)
+            simpson_precedent = None
+            for N, trapeze, nb_evaluations in trapezes:
+                simpson = (4 * trapeze - trapeze_precedent) / 3
+                if simpson_precedent is not None:
+                    # l'erreur de la méthode de Simpson est en h**4
+                    erreur = abs(simpson - simpson_precedent) / 15
+                    if erreur <= tol or 2 * N > N_max:
+                        return simpson, N, erreur, nb_evaluations
+                trapeze_precedent, simpson_precedent = trapeze, simpson
+
+        h = (b - a) / N  # Largeur des subdivisions
+
+        # évaluation de tous les noeuds en un seul appel
+        y = self.__evaluer(a + h * np.arange(N + 1))
+
+        somme_paire = y[2:N:2].sum()  # Sommation paire
+        somme_impaire = y[1:N:2].sum()  # Sommation impaire
+
+        return (h / 3) * (y[0] + 2 * somme_paire +\
+                4 * somme_impaire + y[-1])
+
+    @_instrumente
+    def romberg_naive(self, a, b, n, m):
+        """
+        ------------------------------------------------
+        ------- Méthode d'intégration numérique --------
+        Fonction de l'implémentation naive de la méthode
+        d'intégration de Romberg
+        ATTENTION : Méthode récursive, ell peut utiliser
+                    une grande quantté de mémoire vive
+                    (voir la méthode romberg, qui n'évalue
+                    chaque point qu'une seule fois)
+        ------------------------------------------------
+        Paramètres
+        ============
+        fonc : function
+            Fonction à intégrer
+        a : float
+            Borne inférieure du domaine à intégrer
+        b : float
+            Borne supérieure du domaine à intégrer
+        Retourne
+        ============
+        résultat : float
+            Résultat de l'intégrale définie par la borne a et b
+        """
+        # Paramètres
+        h = (b - a) / 2**n  # largeur des subdivisions
+
+        if n == 0 and m == 0:
+            return h * (self(a) + self(b))
+        elif m == 0:
+            res_somme = 0
+            for i in range(1, 2**(n-1) + 1):
+                res_somme += self(a + h * (2*i - 1))
+            return 1/2 * self.romberg_naive(a, b, n - 1, 0) + h * res_somme
+        else:
+            element_recursif_1 = 4**m * self.romberg_naive(a, b, n, m-1)
+            element_recursif_2 = self.romberg_naive(a, b, n-1, m-1)
+            return (element_recursif_1 - element_recursif_2) / (4**m - 1)
+
+    @_instrumente
+    def romberg(self, a, b, n=20, tol=1e-10):
+        """
+        ------------------------------------------------
+        ------- Méthode d'intégration numérique --------
+        Méthode d'intégration de Romberg construite ligne
+        par ligne. Chaque ligne du tableau n'évalue que
+        les nouveaux points milieux et réutilise tous
+        les points précédents : au plus 2**n + 1
+        évaluations de la fonction
+        ------------------------------------------------
+        Paramètres
+        ============
+        a : float
+            Borne inférieure du domaine à intégrer
+        b : float
+            Borne supérieure du domaine à intégrer
+        n : int
+            default : 20
+            Nombre maximal de lignes du tableau (2**n trapèzes
+            sur la dernière ligne)
+        tol : float
+            default : 1e-10
+            Arrête le calcul dès que deux éléments consécutifs
+            de la diagonale diffèrent de moins de tol. Si None,
+            les n lignes sont calculées
+        Retourne
+        ============
+        résultat : tuple (float, float, int)
+            Estimation de l'intégrale, estimation de l'erreur
+            (différence entre les deux derniers éléments de la
+            diagonale) et nombre d'évaluations de la fonction
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return np.exp(x)
+        >>> ma_fonction.romberg(0, 1, tol=1e-12)
+        (1.7182818284590453, 3.3084646133829665e-14, 33)
+        """
+        # Paramètres
+        n = int(n)
+
+        # première ligne : méthode du trapèze avec une seule division
+        trapezes = self.__trapezes_emboites(a, b, 1)
+        _, trapeze, nb_evaluations = next(trapezes)
+        ligne = [trapeze]
+        erreur = float('inf')
+
+        for k in range(1, n + 1):
+            # seuls les nouveaux points milieux sont évalués
+            _, trapeze, nb_evaluations = next(trapezes)
+
+            # extrapolation de Richardson sur la nouvelle ligne
+            nouvelle_ligne = [trapeze]
+            for m in range(1, k + 1):
+                nouvelle_ligne.append(nouvelle_ligne[m-1] +
+                                      (nouvelle_ligne[m-1] - ligne[m-1]) / (4**m - 1))
+
+            erreur = abs(nouvelle_ligne[k] - ligne[k-1])
+            ligne = nouvelle_ligne
+
+            # au moins deux extrapolations avant de se fier à l'erreur
+            if tol is not None and k >= 2 and erreur <= tol:
+                break
+
+        return ligne[-1], erreur, nb_evaluations
+
+    @_instrumente
+    def gauss_kronrod(self, a, b, tol_abs=1e-10, tol_rel=1e-10, max_evaluations=100000):
+        """
+        ------------------------------------------------
+        ------- Méthode d'intégration numérique --------
+        Méthode d'intégration adaptative de
+        Gauss-Kronrod (7 points de Gauss, 15 points de
+        Kronrod). Les sous-intervalles sont gardés dans
+        un tas ordonné par leur erreur estimée et seul
+        le pire est divisé en deux, jusqu'à ce que
+        l'erreur totale respecte la tolérance
+        ------------------------------------------------
+        Paramètres
+        ============
+        a : float
+            Borne inférieure du domaine à intégrer
+        b : float
+            Borne supérieure du domaine à intégrer
+        tol_abs : float
+            default : 1e-10
+            Tolérance absolue sur l'erreur totale
+        tol_rel : float
+            default : 1e-10
+            Tolérance relative sur l'erreur totale
+        max_evaluations : int
+            default : 100000
+            Nombre maximal d'évaluations de la fonction
+        Retourne
+        ============
+        résultat : tuple (float, float, int)
+            Estimation de l'intégrale, estimation de l'erreur
+            et nombre d'évaluations de la fonction
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return 1 / (1e-4 + (x - 0.3)**2)
+        >>> ma_fonction.gauss_kronrod(0, 1)
+        (309.398691512415, 5.651416905151715e-09, 465)
+        """
+        if a == b:
+            return 0.0, 0.0, 0
+        if a > b:
+            valeur, erreur, nb_evaluations = self.gauss_kronrod(b, a, tol_abs, tol_rel,
+                                                                max_evaluations)
+            return -valeur, erreur, nb_evaluations
+
+        # règle de Kronrod sur [-1, 1] : les 7 points de Gauss-Legendre
+        # suivis des 8 points ajoutés
+        x_gauss, w_gauss = FonctionAnalytique1D.gaussxw(7)
+        x_kronrod = np.concatenate((x_gauss, _KRONROD_POINTS, -_KRONROD_POINTS))
+        w_kronrod = np.concatenate((_KRONROD_POIDS_GAUSS[:-1], _KRONROD_POIDS_GAUSS[::-1],
+                                    _KRONROD_POIDS_AJOUTS, _KRONROD_POIDS_AJOUTS))
+
+        def integrer(bornes_a, bornes_b):
+            # évalue la règle sur plusieurs intervalles en un seul appel
+            bornes_a = np.asarray(bornes_a, float)
+            bornes_b = np.asarray(bornes_b, float)
+            demi_largeur = 0.5*(bornes_b - bornes_a)
+            milieu = 0.5*(bornes_b + bornes_a)
+            y = self.__evaluer(demi_largeur[:, np.newaxis]*x_kronrod + milieu[:, np.newaxis])
+
+            resultat_kronrod = demi_largeur * (y @ w_kronrod)
+            resultat_gauss = demi_largeur * (y[:, :7] @ w_gauss)
+
+            # estimation de l'erreur de QUADPACK
+            moyenne = resultat_kronrod / (2*demi_largeur)
+            res_abs = np.abs(demi_largeur) * (np.abs(y) @ w_kronrod)
+            res_asc = np.abs(demi_largeur) * (np.abs(y - moyenne[:, np.newaxis]) @ w_kronrod)
+            erreur = np.abs(resultat_kronrod - resultat_gauss)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                erreur = np.where(res_asc > 0,
+                                  res_asc*np.minimum(1, (200*erreur/res_asc)**1.5), erreur)
+            erreur = np.maximum(erreur, 50*np.finfo(float).eps*res_abs)
+
+            return resultat_kronrod, erreur
+
+        valeurs, erreurs = integrer([a], [b])
+        nb_evaluations = len(x_kronrod)
+        total = valeurs[0]
+        erreur_totale = erreurs[0]
+
+        # tas des sous-intervalles, le pire en premier ; le compteur départage
+        # les erreurs égales
+        tas = [(-erreurs[0], 0, a, b, valeurs[0], erreurs[0])]
+        termines = []  # intervalles trop petits pour être divisés
+        compteur = 1
+
+        while (erreur_totale > max(tol_abs, tol_rel*abs(total)) and tas and
+               nb_evaluations + 2*len(x_kronrod) <= max_evaluations):
+            _, _, gauche, droite, valeur, erreur = heapq.heappop(tas)
+            milieu = 0.5*(gauche + droite)
+            if not gauche < milieu < droite:
+                termines.append((valeur, erreur))
+                continue
+
+            # les deux moitiés sont évaluées ensemble
+            valeurs, erreurs = integrer([gauche, milieu], [milieu, droite])
+            nb_evaluations += 2*len(x_kronrod)
+            total += valeurs.sum() - valeur
+            erreur_totale += erreurs.sum() - erreur
+
+            for g, d, v, e in zip((gauche, milieu), (milieu, droite), valeurs, erreurs):
+                heapq.heappush(tas, (-e, compteur, g, d, v, e))
+                compteur += 1
+
+        # somme finale sans l'accumulation d'arrondis des mises à jour
+        elements = [(v, e) for *_, v, e in tas] + termines
+        total = np.sum([v for v, _ in elements])
+        erreur_totale = np.sum([e for _, e in elements])
+
+        return total, erreur_totale, nb_evaluations
+
+    @_instrumente
+    def double_exponentielle(self, a, b, tol_abs=1e-10, tol_rel=1e-10, niveau_max=10):
+        """
+        ------------------------------------------------
+        ------- Méthode d'intégration numérique --------
+        Quadrature double exponentielle : un changement
+        de variable x(t) fait décroître l'intégrande
+        en exp(-exp|t|), puis la méthode du trapèze est
+        appliquée sur t. Le pas est divisé par deux à
+        chaque niveau, en réutilisant les points des
+        niveaux précédents. Convient aux singularités
+        intégrables aux bornes (log, 1/sqrt) et aux
+        intervalles infinis :
+            [a, b] fini          : tanh-sinh
+            [a, inf), (-inf, b]  : exp-sinh
+            (-inf, inf)          : sinh-sinh
+        Les points où la fonction n'est pas finie (ex.
+        trop près d'une singularité) sont ignorés
+        ------------------------------------------------
+        Paramètres
+        ============
+        a : float
+            Borne inférieure du domaine à intégrer (peut être -np.inf)
+        b : float
+            Borne supérieure du domaine à intégrer (peut être np.inf)
+        tol_abs : float
+            default : 1e-10
+            Tolérance absolue sur l'erreur
+        tol_rel : float
+            default : 1e-10
+            Tolérance relative sur l'erreur
+        niveau_max : int
+            default : 10
+            Nombre maximal de divisions du pas
+        Retourne
+        ============
+        résultat : tuple (float, float, int)
+            Estimation de l'intégrale, estimation de l'erreur
+            (différence entre les deux derniers niveaux) et
+            nombre d'évaluations de la fonction
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return np.exp(-x**2)
+        >>> ma_fonction.double_exponentielle(-np.inf, np.inf)
+        (1.7724538509055159, 1.4799272918253337e-12, 137)
+        """
+        if a == b:
+            return 0.0, 0.0, 0
+        if a > b:
+            valeur, erreur, nb_evaluations = self.double_exponentielle(b, a, tol_abs, tol_rel,
+                                                                       niveau_max)
+            return -valeur, erreur, nb_evaluations
+
+        if np.isfinite(a) and np.isfinite(b):
+            transformation = 'tanh_sinh'
+            echelle = (b - a) / 2
+        else:
+            transformation = 'sinh_sinh' if np.isinf(a) and np.isinf(b) else 'exp_sinh'
+            echelle = 1.0
+
+        def termes(niveau, t_min=-np.inf, t_max=np.inf):
+            # nouveaux termes du niveau pour t dans [t_min, t_max], et leur t
+            t, y, w = _noeuds_double_exponentielle(transformation, niveau)
+            if transformation == 'tanh_sinh':
+                x = np.where(t < 0, a + echelle*y, b - echelle*y)
+            elif transformation == 'exp_sinh':
+                x = a + y if np.isfinite(a) else b - y
+            else:
+                x = y
+            # points confondus avec une borne à la précision machine
+            garde = (x > a) & (x < b) & (t >= t_min) & (t <= t_max)
+            resultat = w[garde] * self.__evaluer(x[garde])
+            resultat[~np.isfinite(resultat)] = 0
+            return resultat, t[garde]
+
+        valeurs, t = termes(0)
+        total = valeurs.sum()
+        nb_evaluations = len(valeurs)
+
+        # un terme est significatif si sa contribution dépasse la tolérance
+        # absolue. Tant qu'aucun ne l'est (ex. pic étroit entre les points),
+        # la tolérance absolue ne dit rien de la convergence : seul l'accord
+        # relatif de deux niveaux successifs est accepté
+        def significatif(valeurs, h):
+            return echelle * h * np.abs(valeurs).max(initial=0) > tol_abs
+
+        # les niveaux suivants se limitent aux t où les termes du premier
+        # niveau ne sont pas négligeables, plus une marge d'un pas
+        trouve = significatif(valeurs, 1.0)
+        if trouve:
+            significatifs = t[np.abs(valeurs) > np.finfo(float).eps * np.abs(valeurs).max()]
+            t_min, t_max = significatifs.min() - 1, significatifs.max() + 1
+        else:
+            t_min, t_max = -np.inf, np.inf
+        h = 1.0
+        valeur = echelle * h * total
+        erreur = float('inf')
+
+        for niveau in range(1, niveau_max + 1):
+            valeurs, _ = termes(niveau, t_min, t_max)
+            total += valeurs.sum()
+            nb_evaluations += len(valeurs)
+            h /= 2
+            trouve = trouve or significatif(valeurs, h)
+
+            nouvelle_valeur = echelle * h * total
+            erreur = abs(nouvelle_valeur - valeur)
+            valeur = nouvelle_valeur
+
+            # au moins deux divisions avant de se fier à l'erreur
+            if niveau >= 2 and (trouve and erreur <= tol_abs or
+                                valeur != 0 and erreur <= tol_rel * abs(valeur)):
+                break
+
+        return valeur, erreur, nb_evaluations
+
+    @_instrumente
+    def chebyshev(self, a, b, tol=1e-14, degre_max=2**16):
+        """
+        ------------------------------------------------
+        Construit une représentation de la fonction sur
+        [a, b] par une série de Chebyshev (interpolation
+        aux points de Chebyshev, degré choisi selon la
+        décroissance des coefficients). La série est
+        ensuite évaluée, intégrée sur tout sous-intervalle,
+        dérivée et ses racines sont trouvées sans appeler
+        la fonction à nouveau (voir ProxyChebyshev)
+        ------------------------------------------------
+        Paramètres
+        ============
+        a : float
+            Borne inférieure du domaine
+        b : float
+            Borne supérieure du domaine
+        tol : float
+            default : 1e-14
+            Tolérance relative sur les coefficients
+        degre_max : int
+            default : 2**16
+            Degré maximal de la série (si la fonction n'est pas
+            lisse, il est atteint : l'attribut converge de la série
+            est False et son erreur reste grande)
+        Retourne
+        ============
+        résultat : ProxyChebyshev
+            Représentation de la fonction sur [a, b]
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return np.sin(5*x) * np.exp(x)
+        >>> proxy = ma_fonction.chebyshev(0, 2)
+        >>> proxy.degre, proxy(1.0), proxy.integrale(0.5, 1.5)
+        (23, -2.6066264306850933, -0.4290292571491596)
+        >>> proxy.racines()
+        array([2.88657986e-15, 6.28318531e-01, 1.25663706e+00, 1.88495559e+00])
+        """
+        return ProxyChebyshev.construire(self.__evaluer, a, b, tol, degre_max)
+
+    def __derivee_numerique(self):
+        """
+        ------------------------------------------------
+        Retourne une fonction vectorisée évaluant la
+        dérivée : fonc_deriv si la dérivée symbolique
+        est disponible, sinon les différences finies
+        (voir derivee)
+        ------------------------------------------------
+        """
+        if self.__est_analytique():
+            try:
+                if self.fonc_deriv is None:
+                    self.fonc_deriv = _compiler_fonction(sm.Symbol(self.__ana_variable),
+                                                         self.tour_derivees(1)[1])
+                return self.fonc_deriv
+            except Exception:
+                pass
+        return self.derivee
+
+    @_instrumente
+    def racines(self, a, b, N=1000, tol=1e-12, iterations_max=100):
+        """
+        ------------------------------------------------
+        ---------- Méthode de recherche de zéros -------
+        Trouve les racines de la fonction dans [a, b].
+        Les changements de signe sont cherchés sur une
+        grille, puis tous les intervalles trouvés sont
+        raffinés en même temps par la méthode de Newton
+        (dérivée symbolique si disponible, sinon
+        différences finies), protégée par une bissection.
+        Les racines doubles (sans changement de signe)
+        ne sont trouvées que si elles sont sur la grille
+        ------------------------------------------------
+        Paramètres
+        ============
+        a : float
+            Borne inférieure du domaine
+        b : float
+            Borne supérieure du domaine
+        N : int
+            default : 1000
+            Nombre de divisions de la grille (deux racines plus
+            proches que (b - a)/N peuvent être manquées)
+        tol : float
+            default : 1e-12
+            Tolérance relative sur les racines
+        iterations_max : int
+            default : 100
+            Nombre maximal d'itérations
+        Retourne
+        ============
+        résultat : numpy.ndarray
+            Racines triées
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return np.cos(x) - x / 10
+        >>> ma_fonction.racines(0, 10)
+        array([1.42755178, 5.26711643, 7.06889124])
+        """
+        return _resoudre(self.__evaluer, self.__derivee_numerique(), a, b, N, tol,
+                         iterations_max)[0]
+
+    @_instrumente
+    def extremums(self, a, b, N=1000, tol=1e-12, iterations_max=100):
+        """
+        ------------------------------------------------
+        ------- Méthode de recherche d'extremums -------
+        Trouve les minimums et maximums locaux de la
+        fonction dans ]a, b[, racines de sa dérivée
+        (voir racines). La dérivée symbolique et la
+        dérivée seconde sont utilisées si elles sont
+        disponibles, sinon les différences finies
+        ------------------------------------------------
+        Paramètres
+        ============
+        Voir racines
+        Retourne
+        ============
+        résultat : tuple (numpy.ndarray, numpy.ndarray)
+            Positions des minimums et des maximums locaux
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return x**3 - 3*x
+        >>> ma_fonction.extremums(-2, 2)
+        (array([1.]), array([-1.]))
+        """
+        evaluer = None
+        if self.__est_analytique():
+            try:
+                derivee = self.ana_derive()
+                evaluer, deriver = derivee.__evaluer, derivee.__derivee_numerique()
+            except Exception:
+                # dérivée symbolique non compilable (ex. Derivative(re(x), x))
+                pass
+        if evaluer is None:
+            evaluer = self.derivee
+            deriver = functools.partial(self.derivee, ordre=2)
+
+        positions, croissantes = _resoudre(evaluer, deriver, a, b, N, tol, iterations_max)
+        # la dérivée passe du négatif au positif à un minimum
+        return positions[croissantes], positions[~croissantes]
+
+    @_instrumente
+    def cumulative(self, x, a=None, methode='simpson', N=None):
         """
         ------------------------------------------------
         ------- Méthode d'intégration numérique --------
-        Fonction de l'implémentation naive de la méthode
-        d'intégration de Romberg
-        ATTENTION : Méthode récursive, ell peut utiliser
-                    une grande quantté de mémoire vive
+        Méthode calculant en une seule passe toutes les
+        intégrales F(x_k) = intégrale de a à x_k de la
+        fonction, pour un tableau trié d'abscisses x_k.
+        Les points sont partagés entre les segments
+        voisins et évalués en un seul appel. Si
+        l'intégrale analytique est déjà connue
+        (self.fonc_inte), elle est utilisée à la place
         ------------------------------------------------
         Paramètres
         ============
-        fonc : function
-            Fonction à intégrer
+        x : numpy.ndarray
+            Abscisses triées en ordre croissant
         a : float
-            Borne inférieure du domaine à intégrer
-        b : float
-            Borne supérieure du domaine à intégrer
+            default : None
+            Borne inférieure des intégrales (x[0] par défaut)
+        methode : string
+            default : 'simpson'
+            Règle utilisée sur chaque segment :
+            'trapeze', 'simpson' ou 'quad'
+        N : int
+            default : None
+            Nombre de sous-divisions par segment pour 'trapeze'
+            et 'simpson' (1 par défaut), nombre de points de
+            Gauss par segment pour 'quad' (5 par défaut)
         Retourne
         ============
-        résultat : float
-            Résultat de l'intégrale définie par la borne a et b
+        résultat : numpy.ndarray
+            Les intégrales de a à chacun des x_k
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return x**2
+        >>> ma_fonction.cumulative(np.linspace(0, 1, 5))
+        array([0.        , 0.00520833, 0.04166667, 0.140625  , 0.33333333])
         """
-        # Paramètres
-        h = (b - a) / 2**n  # largeur des subdivisions
+        x = np.asarray(x, float)
+        if np.any(np.diff(x) < 0):
+            raise ValueError('Les abscisses doivent être triées en ordre croissant')
+        if a is None:
+            a = x[0]
 
-        if n == 0 and m == 0:
-            return h * (self.fonc(a) + self.fonc(b))
-        elif m == 0:
-            res_somme = 0
-            for i in range(1, 2**(n-1) + 1):
-                res_somme += self.fonc(a + h * (2*i - 1))
-            return 1/2 * self.romberg_naive(a, b, n - 1, 0) + h * res_somme
+        # intégrale analytique déjà connue : évaluation vectorisée
+        if self.fonc_inte is not None:
+            return np.asarray(self.fonc_inte(x)) - self.fonc_inte(a) + np.zeros(x.shape)
+
+        # bornes des segments (a est ajouté au début s'il n'est pas x[0])
+        ajout_a = a != x[0]
+        bornes = np.concatenate(([a], x)) if ajout_a else x
+        largeurs = np.diff(bornes)
+
+        if methode == 'quad':
+            segments = self.quad(bornes[:-1], bornes[1:], 5 if N is None else N)
+        elif methode in ('trapeze', 'simpson'):
+            N = 1 if N is None else int(N)
+            K = N if methode == 'trapeze' else 2*N  # sous-intervalles par segment
+            h = largeurs / K
+
+            # grille fine : les bornes des segments ne sont évaluées qu'une fois
+            grille = bornes[:-1, np.newaxis] + h[:, np.newaxis]*np.arange(K)
+            y = self.__evaluer(np.append(grille.ravel(), bornes[-1]))
+            y_segments = y[:-1].reshape(len(largeurs), K)
+            y_fin = y[K::K]  # dernier point de chaque segment
+
+            if methode == 'trapeze':
+                segments = h * (y_segments[:, 0] / 2 + y_segments[:, 1:].sum(axis=1) + y_fin / 2)
+            else:
+                poids = np.ones(K)
+                poids[1::2] = 4
+                poids[2::2] = 2
+                segments = h / 3 * (y_segments @ poids + y_fin)
         else:
-            element_recursif_1 = 4**m * self.romberg_naive(a, b, n, m-1)
-            element_recursif_2 = self.romberg_naive(a, b, n-1, m-1)
-            return (element_recursif_1 - element_recursif_2) / (4**m - 1)
+            raise ValueError('Méthode inconnue : {0}'.format(methode))
+
+        resultat = np.concatenate(([0], np.cumsum(segments)))
+        return resultat[1:] if ajout_a else resultat
 
     @staticmethod
     def gaussxw(N):
@@ -684,35 +3004,194 @@ class FonctionAnalytique1D:
         # values of N up to 1000.  It is compatible with version 2 and version
         # 3 of Python.
         #
+        # For N > SEUIL_GAUSS_ASYMPTOTIQUE, the points and weights are
+        # computed in O(N) from the asymptotic expansion of the Legendre
+        # polynomial (see _gaussxw_asymptotique).  The results for the last
+        # TAILLE_CACHE_GAUSS values of N are kept in a cache (read-only
+        # arrays), see statistiques_gauss.
+        #
         # Written by Mark Newman <mejn@umich.edu>, June 4, 2011
         # modified by Gabriel Couture
         # You may use, share, or modify this file freely
         #
         ######################################################################
         """
-        # Initial approximation to roots of the Legendre polynomial
-        a = np.linspace(3, 4*N-1, N) / (4 * N+2)
-        x = np.cos(np.pi*a + 1/(8 * N * N * np.tan(a)))
+        N = int(N)
+        resultat = _CACHE_GAUSS.obtenir(N)
+        if resultat is not None:
+            return resultat
 
-        # Find roots using Newton's method
-        epsilon = 1e-15
-        delta = 1.0
-        while delta > epsilon:
-            p0 = np.ones(N, float)
-            p1 = np.copy(x)
-            for k in range(1, N):
-                p0, p1 = p1, ((2*k + 1)*x*p1 - k*p0)/(k + 1)
+        if N > SEUIL_GAUSS_ASYMPTOTIQUE:
+            x, w = _gaussxw_asymptotique(N)
+        else:
+            # Initial approximation to roots of the Legendre polynomial
+            a = np.linspace(3, 4*N-1, N) / (4 * N+2)
+            x = np.cos(np.pi*a + 1/(8 * N * N * np.tan(a)))
 
-            dp = (N+1)*(p0-x*p1)/(1-x*x)
-            dx = p1/dp
-            x -= dx
-            delta = max(abs(dx))
+            # Find roots using Newton's method
+            x, w = _gaussxw_newton(N, x)
 
-        # Calculate the weights
-        w = 2*(N+1)*(N+1)/(N*N*(1-x*x)*dp*dp)
+        # les tableaux sont partagés par tous les appels
+        x.flags.writeable = False
+        w.flags.writeable = False
+        _CACHE_GAUSS.ajouter(N, (x, w))
 
         return x, w
 
+    @staticmethod
+    def configurer_cache_symbolique(taille_max=None, repertoire=None):
+        """
+        ------------------------------------------------
+        Configure le cache partagé des résultats des
+        opérations symboliques (dérivées et intégrales
+        des méthodes ana_*)
+        ------------------------------------------------
+        Paramètres
+        ============
+        taille_max : int
+            default : None
+            Nombre maximal de résultats gardés en mémoire
+            (inchangé si None)
+        repertoire : string
+            default : None
+            Répertoire où les résultats sont aussi conservés
+            pour survivre au redémarrage du processus. Une
+            chaine vide désactive le stockage sur disque
+            (inchangé si None)
+        """
+        global _REPERTOIRE_CACHE_SYMBOLIQUE
+
+        if taille_max is not None:
+            _CACHE_SYMBOLIQUE.taille_max = int(taille_max)
+        if repertoire is not None:
+            if repertoire:
+                os.makedirs(repertoire, exist_ok=True)
+                _REPERTOIRE_CACHE_SYMBOLIQUE = repertoire
+            else:
+                _REPERTOIRE_CACHE_SYMBOLIQUE = None
+
+    @staticmethod
+    def configurer_lambdify(backend=None, cse=None):
+        """
+        ------------------------------------------------
+        Configure la génération des fonctions numériques
+        à partir des expressions symboliques (fonc_deriv,
+        fonc_inte et la fonction des objets retournés par
+        ana_derive et ana_integration_non_def)
+        ------------------------------------------------
+        Paramètres
+        ============
+        backend : string
+            default : None
+            'numpy', 'numexpr' ou 'auto' (numexpr s'il est
+            installé, sinon numpy). Inchangé si None
+        cse : bool
+            default : None
+            True pour calculer une seule fois les sous-expressions
+            communes. Inchangé si None
+        """
+        if backend is not None:
+            if backend not in ('auto', 'numpy', 'numexpr'):
+                raise ValueError('Backend inconnu : {0}'.format(backend))
+            _OPTIONS_LAMBDIFY['backend'] = backend
+        if cse is not None:
+            _OPTIONS_LAMBDIFY['cse'] = bool(cse)
+
+    @staticmethod
+    def statistiques_symbolique():
+        """
+        ------------------------------------------------
+        Retourne les statistiques du cache des résultats
+        symboliques (voir configurer_cache_symbolique)
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : dict
+            Succès, échecs, retraits, taille et taille maximale
+            du cache
+        """
+        return _CACHE_SYMBOLIQUE.statistiques()
+
+    @staticmethod
+    def statistiques_gauss():
+        """
+        ------------------------------------------------
+        Retourne les statistiques du cache des points
+        et poids de Gauss-Legendre (voir gaussxw)
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : dict
+            Succès, échecs, retraits, taille et taille maximale
+            du cache
+        """
+        return _CACHE_GAUSS.statistiques()
+
+    def instrumenter(self, rappel=None):
+        """
+        ------------------------------------------------
+        Active les mesures de l'objet : évaluations de
+        la fonction, durées des méthodes et des étapes
+        symboliques. Les objets retournés par les
+        méthodes analytiques partagent ces mesures.
+        Sans instrumentation, le coût est d'un test
+        par appel de méthode
+        ------------------------------------------------
+        Paramètres
+        ============
+        rappel : function
+            default : None
+            Fonction appelée avec un dict pour chaque mesure
+            (voir Instrumentation)
+        Retourne
+        ============
+        résultat : Instrumentation
+            Les mesures (voir Instrumentation.statistiques)
+        Exemple
+        ============
+        >>> mesures = ma_fonction.instrumenter(rappel=print)
+        >>> ma_fonction.ana_integration_def(0, 1)
+        >>> mesures.statistiques()['etapes']['integre']['total']
+        """
+        if self.__instrumentation is None:
+            self.__instrumentation = Instrumentation(getattr(self.fonc, '__name__', repr(self.fonc)),
+                                                     rappel)
+        elif rappel is not None:
+            self.__instrumentation.rappel = rappel
+        return self.__instrumentation
+
+    def desinstrumenter(self):
+        """
+        ------------------------------------------------
+        Désactive les mesures de l'objet
+        ------------------------------------------------
+        """
+        self.__instrumentation = None
+
+    def statistiques_cache(self):
+        """
+        ------------------------------------------------
+        Retourne les compteurs du cache des évaluations
+        de la fonction (voir le paramètre cache)
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : dict | None si le cache n'est pas activé
+            Succès, échecs, retraits, taille et taille maximale
+        """
+        if self.__cache is None:
+            return None
+        return self.__cache.statistiques()
+
+    def vider_cache(self):
+        """
+        ------------------------------------------------
+        Vide le cache des évaluations de la fonction
+        ------------------------------------------------
+        """
+        if self.__cache is not None:
+            self.__cache.vider()
+
     @staticmethod
     def gaussxwab(a, b, N):
         """
@@ -746,6 +3225,7 @@ class FonctionAnalytique1D:
         x, w = FonctionAnalytique1D.gaussxw(N)
         return 0.5*(b-a)*x + 0.5*(b+a), 0.5*(b-a)*w
 
+    @_instrumente
     def quad(self, a, b, N):
         """
         ------------------------------------------------
@@ -756,9 +3236,9 @@ class FonctionAnalytique1D:
         ------------------------------------------------
         Paramètres
         ============
-        a : float
+        a : float ou numpy.ndarray
             Valeur de la borne inférieure de l'intégration
-        b : float
+        b : float ou numpy.ndarray
             Valeur de la borne supérieure de l'intégration
         N: int
             Nombre de séparation effectué pour l'intégration
@@ -767,33 +3247,235 @@ class FonctionAnalytique1D:
         résultat : float
                     Retourne la valeur numérique de l'intégrale borné
                     entre a et b
+                 : numpy.ndarray
+                    Si a ou b est un tableau, retourne le tableau
+                    des intégrales sur chacun des intervalles (les
+                    bornes sont diffusées l'une sur l'autre). Tous
+                    les points sont évalués en un seul appel
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return x**2
+        >>> ma_fonction.quad(np.array([0, 1, 2]), np.array([1, 2, 3]), N=10)
+        array([0.33333333, 2.33333333, 6.33333333])
         """
-        x, w = FonctionAnalytique1D.gaussxwab(a, b, N)
-        return sum([w_i * self.fonc(x_i) for x_i, w_i in zip(x, w)])
+        if np.ndim(a) == 0 and np.ndim(b) == 0:
+            x, w = FonctionAnalytique1D.gaussxwab(a, b, N)
+            return np.dot(w, self.__evaluer(x))
+
+        # plusieurs intervalles : évaluation de tous les points, de forme
+        # (nombre d'intervalles, N), en un seul appel
+        x, w = FonctionAnalytique1D.gaussxw(N)
+        a, b = np.broadcast_arrays(np.asarray(a, float), np.asarray(b, float))
+        demi_largeur = 0.5*(b - a)
+        milieu = 0.5*(b + a)
+        points = demi_largeur[..., np.newaxis]*x + milieu[..., np.newaxis]
+
+        return demi_largeur * (self.__evaluer(points) @ w)
 
-    def derivee(self, a):
+    @_instrumente
+    def integration_parallele(self, a, b, methode='simpson', N=100, morceaux=None,
+                              workers=None):
         """
         ------------------------------------------------
-        ------- Méthode de dérivation numérique  -------
-        Méthode permettant la dérivation numérique
-        de la fonction
+        ------- Méthode d'intégration parallèle --------
+        Méthode permettant l'intégration d'une fonction
+        coûteuse sur plusieurs processus. L'intervalle
+        [a, b] est séparé en morceaux de même largeur,
+        chacun intégré par la méthode demandée dans un
+        groupe de processus. Les sommes partielles sont
+        additionnées dans l'ordre des morceaux avec
+        math.fsum : le résultat ne dépend pas de l'ordre
+        d'exécution des processus
+        La fonction est transmise aux processus par
+        référence (module et nom) si elle est définie au
+        niveau d'un module, ou par son expression
+        symbolique pour les objets retournés par les
+        méthodes analytiques (voir __reduce__)
         ------------------------------------------------
         Paramètres
         ============
         a : float
-            Valeur à laquelle la dérivée est évaluée
+            Borne inférieure du domaine à intégrer
+        b : float
+            Borne supérieure du domaine à intégrer
+        methode : str
+            default : 'simpson'
+            Méthode utilisée pour chaque morceau : 'trapeze',
+            'simpson' ou 'quad'
+        N : int
+            default : 100
+            Nombre de sous-divisions (ou de points pour 'quad')
+            de chaque morceau
+        morceaux : int
+            default : None
+            Nombre de morceaux. Si None, un morceau par processus.
+            Le résultat ne dépend que du nombre de morceaux
+        workers : int
+            default : None
+            Nombre de processus. Si None, os.cpu_count(). Si 1,
+            les morceaux sont intégrés dans le processus courant
         Retourne
         ============
         résultat : float
+            Résultat de l'intégrale
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return x**2
+        >>> ma_fonction.integration_parallele(0, 3, N=10, workers=4)
+        9.0
+        """
+        if methode not in ('trapeze', 'simpson', 'quad'):
+            raise ValueError('Méthode inconnue : {0}'.format(methode))
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if morceaux is None:
+            morceaux = workers
+
+        bornes = np.linspace(a, b, int(morceaux) + 1).tolist()
+        taches = [(methode, bornes[i], bornes[i + 1], N) for i in range(int(morceaux))]
+
+        if workers == 1:
+            sommes = [_integrer_morceau(self, *tache) for tache in taches]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executeur:
+                sommes = list(executeur.map(_integrer_morceau, itertools.repeat(self),
+                                            *zip(*taches)))
+
+        # réduction compensée, dans l'ordre des morceaux
+        return math.fsum(sommes)
+
+    @_instrumente
+    def derivee(self, a, ordre=1, richardson=False, h=None):
+        """
+        ------------------------------------------------
+        ------- Méthode de dérivation numérique  -------
+        Méthode permettant la dérivation numérique
+        de la fonction par différences centrées. Tous
+        les points des différences (pour tous les a)
+        sont évalués en un seul appel
+        ------------------------------------------------
+        Paramètres
+        ============
+        a : float ou numpy.ndarray
+            Valeur(s) à laquelle la dérivée est évaluée
+        ordre : int
+            default : 1
+            Ordre de la dérivée (de 1 à 4)
+        richardson : bool
+            default : False
+            True pour combiner les différences aux pas h et h/2
+            (extrapolation de Richardson, erreur en h**4) et
+            retourner une estimation de l'erreur
+        h : float ou numpy.ndarray
+            default : None
+            Pas des différences. Par défaut, le pas qui minimise
+            l'erreur totale, multiplié par |a| si |a| > 1
+        Retourne
+        ============
+        résultat : float ou numpy.ndarray
                     Retourne la valeur numérique de la dérivée évalué en a
+                 : si richardson=True | tuple
+                    La dérivée et l'estimation de son erreur
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return np.sin(x)
+        >>> ma_fonction.derivee(np.array([0, np.pi]), richardson=True)
+        (array([ 1., -1.]), array([4.14694971e-09, 4.09286011e-08]))
         """
+        if ordre not in _DIFFERENCES_CENTREES:
+            raise ValueError('L\'ordre de la dérivée doit être entre 1 et 4')
+        decalages, coefficients = _DIFFERENCES_CENTREES[ordre]
+        a = np.asarray(a, float)
+
         # Paramètres
         # -----------------------------------------------
-        h = ERREUR_ARRONDI_C**(1/3)  # valeur approximative de h (le pas pour
-                                     # dérivée) qui minimise l'erreur fait
-                                     # sur la dérivée
+        if h is None:
+            # valeur approximative de h (le pas pour dérivée) qui minimise
+            # l'erreur fait sur la dérivée (erreur en h**2, ou en h**4
+            # avec l'extrapolation de Richardson)
+            puissance = ordre + 4 if richardson else ordre + 2
+            h = ERREUR_ARRONDI_C**(1/puissance) * np.maximum(1, np.abs(a))
+        h = np.asarray(h, float) * np.ones(a.shape)
+
+        # pas h (et h/2 pour l'extrapolation) empilés
+        pas = np.stack((h, h/2)) if richardson else h[np.newaxis]
+        points = a[..., np.newaxis] + pas[..., np.newaxis]*decalages
+        resultats = (self.__evaluer(points) @ coefficients) / pas**ordre
+
+        if not richardson:
+            return resultats[0][()]
+
+        difference = resultats[1] - resultats[0]
+        return (resultats[1] + difference/3)[()], (np.abs(difference)/3)[()]
+
+    @_instrumente
+    def derivee_auto(self, a, ordre=1):
+        """
+        ------------------------------------------------
+        ------ Méthode de dérivation automatique  ------
+        Méthode permettant la dérivation exacte (à la
+        précision machine) de la fonction par nombres
+        duals (voir NombreDual), sans expression
+        symbolique. La fonction est évaluée une seule
+        fois sur tous les points si elle le supporte,
+        sinon point par point. Si la fonction utilise
+        des opérations non supportées (ex. math.sin),
+        la dérivée numérique (derivee) est retournée
+        ------------------------------------------------
+        Paramètres
+        ============
+        a : float ou numpy.ndarray
+            Valeur(s) à laquelle la dérivée est évaluée
+        ordre : int
+            default : 1
+            Ordre de la dérivée (1 ou 2)
+        Retourne
+        ============
+        résultat : float ou numpy.ndarray
+                    La dérivée évaluée en a
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     if x > 0:
+        ...         return x**3
+        ...     return -x**2
+        >>> ma_fonction.derivee_auto(2.0, ordre=2)
+        12.0
+        """
+        if ordre not in (1, 2):
+            raise ValueError('L\'ordre de la dérivée doit être 1 ou 2')
+        a = np.asarray(a, float)
+
+        def deriver(points):
+            # évalue la fonction sur un nombre dual et retourne la dérivée
+            x = NombreDual(points, np.ones_like(points),
+                           np.zeros_like(points) if ordre == 2 else None)
+            if self.__instrumentation is not None:
+                self.__instrumentation.compter(points.size)
+            y = self.fonc(x)
+            if not isinstance(y, NombreDual):
+                # la fonction ne dépend pas de sa variable
+                return np.zeros(points.shape)
+            return np.broadcast_to(y.d1 if ordre == 1 else y.d2, points.shape)
 
-        return (self.fonc(a + h/2) - self.fonc(a - h/2))/h
+        try:
+            if self.__vectorisable is not False:
+                try:
+                    return np.array(deriver(a))[()]
+                except Exception:
+                    if a.ndim == 0:
+                        raise
+            # fonctions avec des conditions : un nombre dual par point
+            return np.array([deriver(a_i) for a_i in a.ravel()]).reshape(a.shape)[()]
+        except Exception:
+            return self.derivee(a, ordre)
 
     def integrate(self, a, b, ana=False):
         """
@@ -808,20 +3490,114 @@ class FonctionAnalytique1D:
         print('Pas encore implémenté')
         return None
 
-    def __call__(self, *args):
-        if len(args) == 0:
-            return self.fonc()
-
-        elif len(args) > 1:
+    def __call__(self, *args, out=None, dtype=None):
+        """
+        ------------------------------------------------
+        Évalue la fonction. Un tableau numpy est passé
+        directement à la fonction (ou point par point si
+        elle ne supporte pas les tableaux)
+        ------------------------------------------------
+        Paramètres
+        ============
+        *args :
+            Arguments de la fonction
+        out : numpy.ndarray
+            default : None
+            Tableau dans lequel le résultat est écrit (avec
+            diffusion), puis retourné. Permet de réutiliser
+            le même tableau d'un appel à l'autre
+        dtype : numpy.dtype
+            default : None
+            Type des arguments et du résultat (ex. np.float32,
+            np.float64, np.complex128)
+        Retourne
+        ============
+        résultat : float, numpy.ndarray ou out
+            Valeur(s) de la fonction
+        Exemple
+        ============
+        >>> @FonctionAnalytique1D
+        ... def ma_fonction(x):
+        ...     return x**2
+        >>> tampon = np.empty(3)
+        >>> ma_fonction(np.array([1., 2., 3.]), out=tampon)
+        array([1., 4., 9.])
+        """
+        if len(args) > 1:
             print('Attention, la fonction contient trop'
                     'd\'arguments pour être une fonction analytique en 1D')
-            string_a_exec = "self.fonc("
-            for i in range(len(args)-1):
-                string_a_exec += str(args[i]) + ','
 
-            return eval(string_a_exec + str(args[-1]) + ')')
+        if dtype is not None:
+            args = tuple(np.asarray(arg, dtype=dtype) for arg in args)
+
+        if len(args) == 1 and isinstance(args[0], np.ndarray) and args[0].ndim > 0:
+            resultat = self.__evaluer(args[0])
+        elif (len(args) == 1 and self.__cache is not None
+                and isinstance(args[0], (int, float, np.number, np.ndarray))
+                and np.asarray(args[0]).dtype.kind in 'iuf'):
+            # passe par le cache des évaluations (valeurs réelles seulement)
+            resultat = self.__evaluer_cache(np.asarray(args[0]))[()]
         else:
-            return self.fonc(args[0])
+            if self.__instrumentation is not None:
+                self.__instrumentation.compter(int(np.size(args[0])) if len(args) == 1 else 1)
+            resultat = self.fonc(*args)
+
+        if out is not None:
+            np.copyto(out, resultat, casting='same_kind')
+            return out
+        if dtype is not None:
+            return np.asarray(resultat, dtype=dtype)[()]
+        return resultat
+
+    def __reduce__(self):
+        # sérialisation (pickle), utilisée pour transmettre la fonction à
+        # d'autres processus. Les caches et les fonctions générées ne sont
+        # pas transmis, ils sont reconstruits au besoin
+        if not self.fonc_originel:
+            return (FonctionAnalytique1D._depuis_expression,
+                    (self.__ana_variable, sm.srepr(self.__ana_expression)))
+
+        module = getattr(self.fonc, '__module__', None)
+        nom = getattr(self.fonc, '__qualname__', None)
+        try:
+            if FonctionAnalytique1D._depuis_reference(module, nom) is self:
+                # fonction décorée : l'objet est retrouvé par son nom
+                return (FonctionAnalytique1D._depuis_reference, (module, nom))
+        except Exception:
+            pass
+
+        taille_cache = self.__cache.taille_max if self.__cache is not None else None
+        return (FonctionAnalytique1D, (self.fonc, taille_cache))
+
+    @staticmethod
+    def _depuis_reference(module, nom):
+        """
+        ------------------------------------------------
+        Retrouve un objet par son module et son nom
+        qualifié (voir __reduce__)
+        ------------------------------------------------
+        """
+        objet = importlib.import_module(module)
+        for partie in nom.split('.'):
+            objet = getattr(objet, partie)
+        return objet
+
+    @staticmethod
+    def _depuis_expression(variable, expression):
+        """
+        ------------------------------------------------
+        Reconstruit un objet à partir du nom de sa
+        variable et de la forme canonique (srepr) de son
+        expression symbolique (voir __reduce__)
+        ------------------------------------------------
+        """
+        expression = sm.sympify(expression)
+        objet = FonctionAnalytique1D(_compiler_fonction(sm.Symbol(variable), expression))
+        objet.__ana_variable = variable
+        objet.__ana_expression = expression
+        objet.__ana = True
+        objet.fonc_originel = False
+        return objet
 
     def __eq__(self, autre_fonction):
         return self.fonc == autre_fonction
@@ -829,4 +3605,196 @@ class FonctionAnalytique1D:
     def __name__(self):
         return self.fonc.__name__
 
+    del _instrumente
+
+
+def _futur_en_echec(futur):
+    # vrai si le futur a été annulé ou s'est terminé par une exception
+    if futur.cancelled():
+        return True
+    return futur.done() and futur.exception() is not None
+
+
+def _executer_tache(fonction, methode, a, b, options):
+    """
+    Exécute une méthode d'intégration d'une fonction. Exécutée
+    dans les fils ou processus d'un ServiceIntegration
+    """
+    return getattr(fonction, methode)(a, b, **options)
+
+
+class ServiceIntegration:
+    """
+    Service d'exécution concurrente d'intégrales. Chaque tâche
+    (fonction, méthode, a, b, options) est exécutée dans un groupe
+    de fils d'exécution ou de processus, et retourne un objet
+    concurrent.futures.Future (voir soumettre) ou un objet
+    attendable par asyncio (voir attendre). Les tâches identiques
+    ne sont calculées qu'une seule fois : elles partagent le même
+    Future, gardé dans un cache borné
+    Exemple :
+    -------------------------------------------------------------
+    >>> with ServiceIntegration(max_workers=8) as service:
+    ...     futurs = service.soumettre_lot([(ma_fonction, 'quad', 0, 1, {'N': 50}),
+    ...                                     (ma_fonction, 'simpson', 0, 2)])
+    ...     resultats = [futur.result() for futur in futurs]
+    Dans une coroutine :
+    >>> resultat = await service.attendre(ma_fonction, 'ana_integration_def', 0, 1)
+    Attributs :
+        soumissions : int
+                Nombre de tâches soumises
+        regroupees : int
+                Nombre de tâches identiques à une tâche déjà soumise
+    """
+    def __init__(self, executeur='thread', max_workers=None, taille_cache=TAILLE_CACHE_SERVICE):
+        """
+        Paramètres
+        ===========
+            executeur : str ou concurrent.futures.Executor
+                    default : 'thread'
+                    'thread' ou 'process' pour un groupe de fils d'exécution
+                    ou de processus, ou un objet Executor existant (qui
+                    n'est alors pas fermé par le service)
+            max_workers : int
+                    default : None
+                    Nombre de fils d'exécution ou de processus
+            taille_cache : int
+                    default : TAILLE_CACHE_SERVICE
+                    Nombre maximal de tâches dont le résultat est gardé
+                    pour être partagé avec les tâches identiques
+        """
+        if executeur == 'thread':
+            self.__executeur = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            self.__proprietaire = True
+        elif executeur == 'process':
+            self.__executeur = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+            self.__proprietaire = True
+        elif isinstance(executeur, concurrent.futures.Executor):
+            self.__executeur = executeur
+            self.__proprietaire = False
+        else:
+            raise ValueError('Exécuteur inconnu : {0!r}'.format(executeur))
+
+        # (fonction, Future) indexés par la tâche. La fonction est gardée pour
+        # que son identifiant (id) ne soit pas réutilisé tant que la tâche y est
+        self.__taches = CacheLRU(taille_cache)
+        self.__verrou = threading.Lock()
+        self.soumissions = 0
+        self.regroupees = 0
+
+    def soumettre(self, fonction, methode, a, b, **options):
+        """
+        ------------------------------------------------
+        Soumet une intégrale au service
+        ------------------------------------------------
+        Paramètres
+        ============
+        fonction : FonctionAnalytique1D
+            Fonction à intégrer
+        methode : str
+            Nom de la méthode d'intégration (ex. 'quad', 'simpson',
+            'gauss_kronrod', 'ana_integration_def')
+        a : float
+            Borne inférieure de l'intégrale
+        b : float
+            Borne supérieure de l'intégrale
+        **options :
+            Autres paramètres de la méthode (ex. N=100)
+        Retourne
+        ============
+        résultat : concurrent.futures.Future
+            Futur du résultat de la méthode
+        """
+        if not callable(getattr(fonction, methode, None)):
+            raise ValueError('Méthode inconnue : {0}'.format(methode))
+        try:
+            cle = (id(fonction), methode, a, b, tuple(sorted(options.items())))
+            hash(cle)
+        except TypeError:
+            # options non hachables : la tâche n'est pas regroupée
+            cle = None
+
+        with self.__verrou:
+            self.soumissions += 1
+            if cle is not None:
+                tache = self.__taches.obtenir(cle)
+                # une tâche annulée ou en échec est soumise à nouveau
+                if tache is not None and not _futur_en_echec(tache[1]):
+                    self.regroupees += 1
+                    return tache[1]
+
+            futur = self.__executeur.submit(_executer_tache, fonction, methode, a, b, options)
+            if cle is not None:
+                self.__taches.ajouter(cle, (fonction, futur))
+            return futur
+
+    def soumettre_lot(self, taches):
+        """
+        ------------------------------------------------
+        Soumet plusieurs intégrales au service
+        ------------------------------------------------
+        Paramètres
+        ============
+        taches : iterable de tuple
+            (fonction, methode, a, b) ou
+            (fonction, methode, a, b, options), où options est
+            un dict des autres paramètres de la méthode
+        Retourne
+        ============
+        résultat : list de concurrent.futures.Future
+            Futurs des résultats, dans l'ordre des tâches
+        """
+        futurs = []
+        for tache in taches:
+            fonction, methode, a, b = tache[:4]
+            options = tache[4] if len(tache) > 4 else {}
+            futurs.append(self.soumettre(fonction, methode, a, b, **options))
+        return futurs
+
+    def attendre(self, fonction, methode, a, b, **options):
+        """
+        ------------------------------------------------
+        Soumet une intégrale au service et retourne un
+        objet attendable par asyncio (await), qui ne
+        bloque pas la boucle d'événements
+        ------------------------------------------------
+        Paramètres
+        ============
+        Voir soumettre
+        Retourne
+        ============
+        résultat : asyncio.Future
+            Futur du résultat de la méthode
+        """
+        return asyncio.wrap_future(self.soumettre(fonction, methode, a, b, **options))
+
+    def statistiques(self):
+        """
+        ------------------------------------------------
+        Retourne les compteurs du service
+        ------------------------------------------------
+        Retourne
+        ============
+        résultat : dict
+            Tâches soumises, tâches regroupées et état du
+            cache des tâches
+        """
+        return {'soumissions': self.soumissions,
+                'regroupees': self.regroupees,
+                'cache': self.__taches.statistiques()}
+
+    def fermer(self, attendre=True):
+        """
+        ------------------------------------------------
+        Ferme le groupe de fils d'exécution ou de
+        processus créé par le service
+        ------------------------------------------------
+        """
+        if self.__proprietaire:
+            self.__executeur.shutdown(wait=attendre)
+
+    def __enter__(self):
+        return self
 
+    def __exit__(self, *exc):
+        self.fermer()
@@ -0,0 +1,278 @@
+"""
+Benchmarks for the numeric and symbolic methods of FonctionAnalytique1D.
+
+Every method runs on a fixed set of reference integrands (smooth, peaked,
+oscillatory and log-singular), sweeping N. For each run, the script reports
+wall time, number of function evaluations, peak memory (tracemalloc) and the
+error against the exact value given by ana_integration_def (or ana_derive_a
+for derivatives). Results are saved as JSON so that runs can be compared.
+
+Usage:
+    python benchmarks.py
+    python benchmarks.py --N 10 100 1000 --repetitions 5 --output bench.json
+"""
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import warnings
+import tracemalloc
+
+import numpy as np
+
+import analytic1d
+from analytic1d import FonctionAnalytique1D
+
+
+##################################################
+# Reference integrands (name, domain, point where derivatives are taken)
+##################################################
+
+@FonctionAnalytique1D
+def smooth(x):
+    return np.exp(x) * np.cos(x)
+
+
+@FonctionAnalytique1D
+def peaked(x):
+    return 1 / (0.0001 + (x - 0.3) ** 2)
+
+
+@FonctionAnalytique1D
+def oscillatory(x):
+    return x * np.cos(50 * x)
+
+
+@FonctionAnalytique1D
+def log_singular(x):
+    return np.log(x)
+
+
+INTEGRANDS = [
+    ('smooth', smooth, 0.0, 1.0, 0.5),
+    ('peaked', peaked, 0.0, 1.0, 0.35),
+    ('oscillatory', oscillatory, 0.0, 1.0, 0.5),
+    ('log_singular', log_singular, 0.0, 1.0, 0.5),
+]
+
+N_DEFAULT = [10, 100, 1000, 10000]
+
+
+# Helpers
+# ----------------------------------------------------------
+
+def counted(function):
+    """
+    Returns a new FonctionAnalytique1D wrapping the same Python function,
+    with a counter of the number of points at which it is evaluated
+    """
+    def wrapper(x):
+        wrapper.evaluations += np.size(x)
+        return function.fonc(x)
+    wrapper.evaluations = 0
+    return FonctionAnalytique1D(wrapper), wrapper
+
+
+def measure(call, repetitions):
+    """
+    Runs call() `repetitions` times and returns the result, the best wall
+    time and the peak memory of one extra run traced with tracemalloc
+    """
+    best = math.inf
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        result = call()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def to_json(value):
+    # NaN and infinities are not valid JSON
+    if isinstance(value, (complex, np.complexfloating)):
+        value = abs(value)
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def run(name, label, parameter, call, exact, evaluations, repetitions):
+    """
+    Benchmarks one call and returns its record
+    """
+    if evaluations is not None:
+        evaluations.evaluations = 0
+    try:
+        result, seconds, peak = measure(call, repetitions)
+    except Exception as error:
+        return {'integrand': name, 'method': label, 'N': parameter,
+                'error_message': repr(error)}
+
+    if isinstance(result, tuple):
+        # adaptive methods also return their error estimate and evaluations
+        result = result[0]
+    count = None
+    if evaluations is not None:
+        count = evaluations.evaluations // (repetitions + 1)
+    with np.errstate(invalid='ignore'):
+        error = abs(result - exact) if exact is not None else None
+    return {'integrand': name,
+            'method': label,
+            'N': parameter,
+            'seconds': seconds,
+            'evaluations': count,
+            'peak_memory_bytes': peak,
+            'value': to_json(result),
+            'error': to_json(error) if error is not None else None}
+
+
+def exact_values(function, a, b, x0):
+    """
+    Exact integral on [a, b] and exact first and second derivatives at x0
+    (symbolic). When the antiderivative cannot be evaluated at a bound
+    (ex. x*log(x) at 0), sympy computes the definite integral directly
+    """
+    integral = first = second = None
+    try:
+        integral = function.ana_integration_def(a, b, methode_numerique=None)
+        if not np.isfinite(integral):
+            variable, expression = function._expression_analytique()
+            integral = analytic1d.sm.integrate(expression, (variable, a, b))
+        integral = float(integral)
+    except Exception:
+        pass
+    try:
+        first = float(function.ana_derive_a(x0))
+        second = float(function.ana_derive(ordre=2)(x0))
+    except Exception:
+        pass
+    return integral, first, second
+
+
+# Benchmarks
+# ----------------------------------------------------------
+
+def benchmark_integrand(name, function, a, b, x0, N_values, repetitions):
+    records = []
+    integral, derivative, second_derivative = exact_values(function, a, b, x0)
+    numeric, counter = counted(function)
+
+    def add(label, parameter, call, exact, count=True):
+        records.append(run(name, label, parameter, call, exact,
+                           counter if count else None, repetitions))
+
+    for N in N_values:
+        add('trapeze', N, lambda: numeric.trapeze(a, b, N), integral)
+        add('simpson', N, lambda: numeric.simpson(a, b, N), integral)
+        add('quad', N, lambda: numeric.quad(a, b, N), integral)
+
+    # the number of evaluations of romberg_naive grows as 2**n
+    for n in range(1, 9):
+        add('romberg_naive', n, lambda: numeric.romberg_naive(a, b, n, n), integral)
+
+    # all the rows are built (no tolerance)
+    for n in (5, 10, 20):
+        add('romberg', n, lambda: numeric.romberg(a, b, n, tol=None), integral)
+    add('gauss_kronrod', None, lambda: numeric.gauss_kronrod(a, b), integral)
+
+    for ordre in (1, 2):
+        exact = derivative if ordre == 1 else second_derivative
+        add('derivee(ordre={0})'.format(ordre), None,
+            lambda: numeric.derivee(x0, ordre), exact)
+    add('derivee(richardson)', None, lambda: numeric.derivee(x0, richardson=True), derivative)
+    add('derivee_auto', None, lambda: numeric.derivee_auto(x0), derivative)
+
+    # symbolic methods: first call (analysis, sympy and code generation) and
+    # later calls (cached results). The numeric fallback of ana_integration_def
+    # is disabled so that the symbolic path is timed
+    def cold(method, **options):
+        def call():
+            analytic1d._CACHE_SYMBOLIQUE.vider()
+            analytic1d._CACHE_LAMBDIFY.vider()
+            return getattr(FonctionAnalytique1D(function.fonc), method[0])(*method[1:], **options)
+        return call
+
+    add('ana_integration_def (cold)', None,
+        cold(('ana_integration_def', a, b), methode_numerique=None), integral, count=False)
+    add('ana_integration_def (warm)', None,
+        lambda: function.ana_integration_def(a, b, methode_numerique=None),
+        integral, count=False)
+    add('ana_derive_a (cold)', None, cold(('ana_derive_a', x0)), derivative, count=False)
+    add('ana_derive_a (warm)', None, lambda: function.ana_derive_a(x0),
+        derivative, count=False)
+    return records
+
+
+def benchmark_gaussxw(N_values, repetitions):
+    # generation of the Gauss-Legendre nodes and weights, without the cache
+    records = []
+    for N in N_values:
+        def call():
+            analytic1d._CACHE_GAUSS.vider()
+            return FonctionAnalytique1D.gaussxw(N)[1].sum()
+        records.append(run('-', 'gaussxw', N, call, 2.0, None, repetitions))
+    return records
+
+
+def print_table(records):
+    line = '{:<14} {:<28} {:>6} {:>11} {:>11} {:>12} {:>10}'
+    print(line.format('integrand', 'method', 'N', 'time (s)', 'evaluations',
+                      'memory (B)', 'error'))
+    for record in records:
+        if 'error_message' in record:
+            print(line.format(record['integrand'], record['method'], str(record['N']),
+                              'failed', '', '', record['error_message'][:10]))
+            continue
+        error = record['error']
+        print(line.format(record['integrand'], record['method'],
+                          '-' if record['N'] is None else str(record['N']),
+                          '{:.3e}'.format(record['seconds']),
+                          '-' if record['evaluations'] is None else str(record['evaluations']),
+                          str(record['peak_memory_bytes']),
+                          '-' if error is None else '{:.2e}'.format(error)))
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--N', type=int, nargs='+', default=N_DEFAULT,
+                        help='values of N for trapeze, simpson, quad and gaussxw')
+    parser.add_argument('--repetitions', type=int, default=3,
+                        help='number of timed runs (the best one is kept)')
+    parser.add_argument('--integrands', nargs='+',
+                        choices=[integrand[0] for integrand in INTEGRANDS],
+                        help='integrands to benchmark (default: all)')
+    parser.add_argument('--output', default='benchmarks.json',
+                        help='JSON output file')
+    options = parser.parse_args(arguments)
+
+    # singular integrands give infinite values on purpose
+    warnings.simplefilter('ignore', RuntimeWarning)
+
+    records = []
+    for name, function, a, b, x0 in INTEGRANDS:
+        if options.integrands and name not in options.integrands:
+            continue
+        records += benchmark_integrand(name, function, a, b, x0, options.N,
+                                       options.repetitions)
+    records += benchmark_gaussxw(options.N, options.repetitions)
+
+    print_table(records)
+
+    report = {'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'python': platform.python_version(),
+              'numpy': np.__version__,
+              'platform': platform.platform(),
+              'repetitions': options.repetitions,
+              'results': records}
+    with open(options.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print('\nResults saved to', options.output)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
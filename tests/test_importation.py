@@ -0,0 +1,35 @@
+"""
+Les méthodes numériques ne doivent importer ni sympy, ni matplotlib
+"""
+import os
+import sys
+import subprocess
+import unittest
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CODE = '''
+import sys
+import numpy as np
+from analytic1d import FonctionAnalytique1D
+
+f = FonctionAnalytique1D(np.exp)
+f.trapeze(0, 1)
+f.quad(0, 1, 10)
+f.derivee(0.5)
+
+modules = [nom for nom in ('sympy', 'matplotlib') if nom in sys.modules]
+assert not modules, modules
+'''
+
+
+class TestImportation(unittest.TestCase):
+
+    def test_methodes_numeriques_sans_sympy_ni_matplotlib(self):
+        resultat = subprocess.run([sys.executable, '-c', CODE], cwd=RACINE,
+                                  capture_output=True, text=True)
+        self.assertEqual(resultat.returncode, 0, resultat.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()